@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+# This file is placed in the public domain or under the
+# CC0-1.0-Universal license, whichever is more permissive.
+
+"""benchmark-check-peps: Benchmark the check-peps rules over the PEPs and synthetic worst cases.
+
+Usage: benchmark-check-peps [--rounds N] [--save FILE] [--compare FILE] [--tolerance RATIO]
+
+Each header validator is timed over every header of its kind in the PEPs,
+and the helpers (``_thread``, ``_email`` and ``_date``) over every call the
+validators make to them. The whole header block and direct-link search
+are also timed per PEP. Each is then timed over synthetic inputs which
+are far longer than any PEP has today.
+
+Rules are repeated until each round takes at least 50ms, and the best of
+several rounds is reported, as the time per input and the inputs checked
+per second.
+
+Use "--save" to record the results as a baseline, and "--compare" to
+fail if any rule is more than "--tolerance" times slower per input than
+in the baseline (default 2, as timings on shared machines are noisy).
+"""
+
+from __future__ import annotations
+
+import collections
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+from pep_metadata.headers import header_lines
+from pep_metadata.headers import tokenize_headers
+
+# Import "check-peps.py" as "check_peps", unless it already has been
+if "check_peps" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("check_peps", Path(__file__).with_name("check-peps.py"))
+    sys.modules["check_peps"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["check_peps"])
+import check_peps  # NoQA: E402
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from typing import TypeAlias
+
+    # (positional arguments, keyword arguments) for one call to a rule
+    Call: TypeAlias = tuple[tuple, dict[str, object]]
+
+# Helpers called by the header validators, benchmarked with the arguments they are given
+HELPERS = ("_thread", "_email", "_date")
+
+DEFAULT_ROUNDS = 5
+# Rules are repeated until each round takes at least this long
+MIN_ROUND_SECONDS = 0.05
+DEFAULT_TOLERANCE = 2.0
+
+
+def corpus_inputs(filenames: Iterable[Path]) -> dict[str, tuple[Callable, list[Call]]]:
+    """Collect the calls to each rule made when checking the given PEPs."""
+    texts = [filename.read_text(encoding="utf-8") for filename in filenames]
+    inputs: dict[str, tuple[Callable, list[Call]]] = {
+        "headers": (check_peps._check_headers, [((header_lines(text),), {}) for text in texts]),
+        "direct-links": (check_peps._check_direct_links_text, [((text,), {}) for text in texts]),
+    }
+    for text in texts:
+        for header in tokenize_headers(header_lines(text)):
+            if (validator := check_peps.HEADER_VALIDATORS.get(header.name)) is not None:
+                calls = inputs.setdefault(f"header-{header.name.lower()}", (validator, []))[1]
+                calls.append(((header.line_num, header.value.lstrip()), {}))
+
+    # Record the arguments the validators pass to each helper
+    for name in HELPERS:
+        inputs[name] = getattr(check_peps, name), []
+    originals = {name: getattr(check_peps, name) for name in HELPERS}
+    try:
+        for name, helper in originals.items():
+            setattr(check_peps, name, _recording(helper, inputs[name][1]))
+        for rule, (validator, calls) in list(inputs.items()):
+            if rule.startswith("header-"):
+                _run(validator, calls)
+    finally:
+        for name, helper in originals.items():
+            setattr(check_peps, name, helper)
+    return inputs
+
+
+def synthetic_inputs() -> dict[str, tuple[Callable, list[Call]]]:
+    """Calls to each rule with inputs much longer than those in any PEP."""
+    authors = ",\n        ".join(f"Author Number{i} <author.{i}@example.com>" for i in range(200))
+    posts = ",\n              ".join(
+        f"`{i % 28 + 1:02}-Jan-2020 <https://discuss.python.org/t/thread-name-{i}/{i + 1000}/{i}>`__"
+        for i in range(300)
+    )
+    body = "See https://peps.python.org/pep-\n and the pep-8 rfc-2822 rfcs. " * 20_000
+    topic_name = "-".join(["word"] * 2_000)
+    return {
+        "headers": (check_peps._check_headers, [(([
+            "PEP: 9999",
+            "Title: Benchmark",
+            f"Author: {authors}",
+            "Status: Draft",
+            "Type: Standards Track",
+            "Created: 01-Jan-2020",
+            f"Post-History: {posts}",
+        ],), {})]),
+        "direct-links": (check_peps._check_direct_links_text, [((body,), {})]),
+        "header-author": (check_peps.HEADER_VALIDATORS["Author"], [((3, authors), {})]),
+        "header-post-history": (check_peps.HEADER_VALIDATORS["Post-History"], [((7, posts), {})]),
+        "header-title": (check_peps.HEADER_VALIDATORS["Title"], [((2, "A" * 10_000), {})]),
+        "_thread": (check_peps._thread, [
+            ((1, f"https://discuss.python.org/t/{topic_name}/123/4", "Post-History"), {}),
+            ((1, f"https://mail.python.org/archives/list/{topic_name}@python.org/thread/abc", "Post-History"), {}),
+        ]),
+        "_email": (check_peps._email, [
+            ((1, f"{'Name ' * 2_000}<{'a.' * 5_000}@example.com>", "Author"), {}),
+            ((1, f"Name <{'a' * 10_000}>", "Author"), {}),
+        ]),
+        "_date": (check_peps._date, [((1, "01-Jan-2020" * 1_000, "Created"), {})]),
+    }
+
+
+def benchmark(inputs: dict[str, tuple[Callable, list[Call]]], rounds: int) -> dict[str, float]:
+    """Time each rule over its inputs, returning the best seconds per input."""
+    results = {}
+    for rule, (func, calls) in sorted(inputs.items()):
+        if not calls:
+            continue
+        # As with timeit, repeat short rules so that timer noise is negligible
+        repeat = 1
+        while _time_round(func, calls, repeat) < MIN_ROUND_SECONDS:
+            repeat *= 2
+        best = min(_time_round(func, calls, repeat) for _ in range(rounds))
+        results[rule] = best / (len(calls) * repeat)
+    return results
+
+
+def _time_round(func: Callable, calls: Sequence[Call], repeat: int) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        # Each run starts with an empty email cache, as in a fresh check
+        check_peps._email_errors.cache_clear()
+        started = time.perf_counter()
+        _run(func, calls)
+        total += time.perf_counter() - started
+    return total
+
+
+def regressions(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """Rules more than `tolerance` times slower per input than in the baseline."""
+    return [
+        rule for rule, seconds in results.items()
+        if rule in baseline and seconds > baseline[rule] * tolerance
+    ]
+
+
+def _recording(func: Callable, calls: list[Call]) -> Callable:
+    def wrapper(*args, **kwargs):
+        calls.append((args, kwargs))
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _run(func: Callable, calls: Sequence[Call]) -> None:
+    for args, kwargs in calls:
+        # The rules are generators, so each must be run to completion
+        collections.deque(func(*args, **kwargs), maxlen=0)
+
+
+def _output(suite: str, inputs: dict[str, tuple[Callable, list[Call]]], results: dict[str, float]) -> None:
+    print(f"{suite:<24} {'Inputs':>7} {'Mean µs':>9} {'Inputs/s':>10}")
+    for rule, seconds in results.items():
+        count = len(inputs[rule][1])
+        print(f"{rule:<24} {count:>7} {seconds * 1e6:>9.1f} {1 / seconds:>10.0f}")
+    print()
+
+
+def main(args: Sequence[str]) -> int:
+    rounds = DEFAULT_ROUNDS
+    tolerance = DEFAULT_TOLERANCE
+    save_file = compare_file = None
+    args = iter(args)
+    for arg in args:
+        if arg in {"-h", "--help"}:
+            print(__doc__, file=sys.stderr)
+            return 0
+        if arg == "--rounds":
+            rounds = int(next(args, "0"))
+        elif arg == "--save":
+            save_file = Path(next(args, ""))
+        elif arg == "--compare":
+            compare_file = Path(next(args, ""))
+        elif arg == "--tolerance":
+            tolerance = float(next(args, "0"))
+        else:
+            print(f"Unknown option: {arg!r}", file=sys.stderr)
+            return 1
+
+    results = {}
+    for suite, inputs in (
+        ("corpus", corpus_inputs(check_peps._all_peps())),
+        ("synthetic", synthetic_inputs()),
+    ):
+        suite_results = benchmark(inputs, rounds)
+        _output(suite, inputs, suite_results)
+        results |= {f"{suite}:{rule}": seconds for rule, seconds in suite_results.items()}
+
+    if save_file is not None:
+        save_file.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+    if compare_file is not None:
+        baseline = json.loads(compare_file.read_text(encoding="utf-8"))
+        if slower := regressions(results, baseline, tolerance):
+            for rule in slower:
+                ratio = results[rule] / baseline[rule]
+                print(f"{rule} is {ratio:.2f} times slower than the baseline", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -34,6 +34,24 @@ def create_parser():
         default="build",
         help="Output directory, relative to root. Default 'build'.",
     )
+    parser.add_argument(
+        "-p",
+        "--pep",
+        type=int,
+        metavar="NUMBER",
+        help="Render only this PEP, to a 'single-pep' directory within the output directory. "
+             "Only the PEP and the PEPs it links to are read, and they are cached between runs.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profile.json",
+        metavar="FILE",
+        help="Record the time and memory used by each phase of the build and each document, "
+             "write them as JSON to FILE in the output directory (default 'profile.json'), "
+             "and show the slowest documents. Disables parallel building.",
+    )
 
     return parser.parse_args()
 
@@ -59,18 +77,55 @@ if __name__ == "__main__":
 
     # builder configuration
     sphinx_builder = args.builder or "html"
+    # Documents must be read and written in this process to be profiled
+    jobs = 1 if args.profile else os.cpu_count() or 1
 
-    app = Sphinx(
-        source_directory,
-        confdir=source_directory,
-        outdir=build_directory / sphinx_builder,
-        doctreedir=build_directory / "doctrees",
-        buildername=sphinx_builder,
-        warningiserror=True,
-        parallel=os.cpu_count() or 1,
-        tags=["internal_builder"],
-        keep_going=True,
-    )
-    app.build()
+    if args.pep is None:
+        app = Sphinx(
+            source_directory,
+            confdir=source_directory,
+            outdir=build_directory / sphinx_builder,
+            doctreedir=build_directory / "doctrees",
+            buildername=sphinx_builder,
+            warningiserror=True,
+            parallel=jobs,
+            tags=["internal_builder"],
+            keep_going=True,
+        )
+        filenames = []
+    else:
+        docname = f"pep-{args.pep:0>4}"
+        pep_file = source_directory / f"{docname}.rst"
+        if not pep_file.is_file():
+            raise SystemExit(f"PEP {args.pep} not found: {pep_file}")
+        # Each PEP has its own small environment, cached between runs. Other PEPs
+        # aren't read, so the indices and RSS feed are skipped, and references
+        # to other documents may warn.
+        single_directory = build_directory / "single-pep"
+        app = Sphinx(
+            source_directory,
+            confdir=source_directory,
+            outdir=single_directory / sphinx_builder,
+            doctreedir=single_directory / "doctrees" / docname,
+            buildername=sphinx_builder,
+            confoverrides={"master_doc": docname},  # see pep_sphinx_extensions.single_pep
+            parallel=1,
+            tags=["internal_builder", "single_pep"],
+            keep_going=True,
+        )
+        # Write only this PEP and its ancillary files, not the linked PEPs
+        filenames = [os.fspath(pep_file), *map(os.fspath, pep_file.with_suffix("").glob("*.rst"))]
+
+    if args.profile:
+        from pep_sphinx_extensions.profiling import BuildProfiler
+
+        profiler = BuildProfiler(app)
+        app.build(filenames=filenames)
+        profiler.close()
+        profiler.write_report(build_directory / args.profile)
+        profiler.print_summary()
+    else:
+        app.build(filenames=filenames)
 
-    create_index_file(build_directory, sphinx_builder)
+    if args.pep is None:
+        create_index_file(build_directory, sphinx_builder)
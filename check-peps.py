@@ -5,35 +5,81 @@
 
 """check-peps: Check PEPs for common mistakes.
 
-Usage: check-peps [-d | --detailed] <PEP files...>
+Usage: check-peps [-d | --detailed] [-j N | --jobs N] [--no-cache]
+                  [--format {text,jsonl,sarif}] [--watch | --graph] [--timings]
+                  [--enable RULES] [--disable RULES] <PEP files...>
 
 Only the PEPs specified are checked.
 If none are specified, all PEPs are checked.
 
-Use "--detailed" to show the contents of lines where errors were found.
+Use "--detailed" to show the contents of lines where errors were found,
+and statistics for the email validation cache.
+Use "--format jsonl" or "--format sarif" for machine-readable output,
+written as each error is found.
+Use "--jobs N" to check PEPs in N parallel processes.
+
+Use "--enable" to run only the given comma-separated rules, or "--disable"
+to skip them. Use "--timings" to show how long each rule took.
+
+Use "--watch" to keep running, re-checking PEPs as they are saved and
+reporting new ("+") and fixed ("-") errors.
+
+Use "--graph" to check references between PEPs instead: that the PEPs in
+"Requires", "Replaces" and "Superseded-By" exist, that "Replaces" and
+"Superseded-By" link back to each other, and that no references form a cycle.
+
+PEPs whose contents are unchanged since they last passed every check are
+skipped. Use "--no-cache" to check them regardless.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from collections import Counter
 from pathlib import Path
 
+import pep_metadata
+from pep_metadata.headers import HEADER_PATTERN  # NoQA: F401 (re-exported)
+from pep_metadata.headers import header_lines
+from pep_metadata.headers import read_header_lines
+from pep_metadata.headers import tokenize_headers
+from pep_metadata.thread_urls import classify_thread_url
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, KeysView, Sequence
+    from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping, Sequence
     from typing import TypeAlias
 
+    from pep_metadata.thread_urls import ThreadURL
+
     # (line number, warning message)
     Message: TypeAlias = tuple[int, str]
     MessageIterator: TypeAlias = Iterator[Message]
+    # (rule id, line number, warning message)
+    RuleMessage: TypeAlias = tuple[str, int, str]
+    RuleMessageIterator: TypeAlias = Iterator[RuleMessage]
+    # {header name: (line number, referenced PEP numbers)}
+    References: TypeAlias = dict[str, tuple[int, list[int]]]
 
 
 # get the directory with the PEP sources
 ROOT_DIR = Path(__file__).resolve().parent
 PEP_ROOT = ROOT_DIR / "peps"
 
+# Contents of PEPs which passed every check, by filename
+CACHE_FILE = ROOT_DIR / ".check-peps-cache.json"
+# Changes to the checks, including those in the shared pep_metadata
+# package, must invalidate previously clean results
+CHECKER_SOURCES = (Path(__file__).resolve(), *sorted(Path(pep_metadata.__file__).parent.glob("*.py")))
+CHECKER_DIGEST = hashlib.sha256(b"".join(source.read_bytes() for source in CHECKER_SOURCES)).hexdigest()
+
 # See PEP 12 for the order
 # Note we retain "BDFL-Delegate"
 ALL_HEADERS = (
@@ -56,6 +102,11 @@ ALL_HEADERS = (
 )
 REQUIRED_HEADERS = frozenset({"PEP", "Title", "Author", "Status", "Type", "Created"})
 
+# Headers which reference other PEPs, checked by "--graph"
+REFERENCE_HEADERS = ("Requires", "Replaces", "Superseded-By")
+# A PEP replacing another must be referenced by it in turn
+BACK_LINK_HEADERS = {"Replaces": "Superseded-By", "Superseded-By": "Replaces"}
+
 # See PEP 1 for the full list
 ALL_STATUSES = frozenset({
     "Accepted",
@@ -75,164 +126,657 @@ SKIP_DIRECT_PEP_LINK_CHECK = frozenset({"0009", "0287", "0676", "0684", "8001"})
 
 DEFAULT_FLAGS = re.ASCII | re.IGNORECASE  # Insensitive latin
 
-# any sequence of letters or '-', followed by a single ':' and a space or end of line
-HEADER_PATTERN = re.compile(r"^([a-z\-]+):(?: |$)", DEFAULT_FLAGS)
 # any sequence of unicode letters or legal special characters
 NAME_PATTERN = re.compile(r"(?:[^\W\d_]|[ ',\-.])+(?: |$)")
 # any sequence of ASCII letters, digits, or legal special characters
 EMAIL_LOCAL_PART_PATTERN = re.compile(r"[\w!#$%&'*+\-/=?^{|}~.]+", DEFAULT_FLAGS)
 
-DISCOURSE_THREAD_PATTERN = re.compile(r"([\w\-]+/)?\d+", DEFAULT_FLAGS)
-DISCOURSE_POST_PATTERN = re.compile(r"([\w\-]+/)?\d+(/\d+)?", DEFAULT_FLAGS)
+MAILING_LIST_NAME_PATTERN = re.compile(r"[\w\-]+")
 
-MAILMAN_2_PATTERN = re.compile(r"[\w\-]+/\d{4}-[a-z]+/\d+\.html", DEFAULT_FLAGS)
-MAILMAN_3_THREAD_PATTERN = re.compile(r"[\w\-]+@python\.org/thread/[a-z0-9]+/?", DEFAULT_FLAGS)
-MAILMAN_3_MESSAGE_PATTERN = re.compile(r"[\w\-]+@python\.org/message/[a-z0-9]+/?(#[a-z0-9]+)?", DEFAULT_FLAGS)
+# direct links to PEPs or RFCs in lowercased text, which should use the
+# :pep: or :rfc: roles. Each alternative begins with a literal so the search
+# can skip quickly through the text, then checks the rest of the URL behind it.
+# The first three characters of a match are the kind of link, "pep" or "rfc".
+DIRECT_LINK_PATTERN = re.compile(
+    r"pep-(?:(?<=dev/peps/pep-)|(?<=peps\.python\.org/pep-))"
+    r"|rfc(?:(?<=rfc-editor\.org/rfc)/|(?<=ietf\.org/doc/html/rfc))"
+)
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+PEP_FILENAME_PATTERN = re.compile(r"pep-\d{4}\.rst")
+# PEPs generated by the build, which are not checked when checking all PEPs
+GENERATED_PEPS = frozenset({"pep-0000.rst"})
 
 # Controlled by the "--detailed" flag
 DETAILED_ERRORS = False
+# Seconds between checks for modified PEPs in "--watch" mode
+WATCH_INTERVAL = 0.2
+
+# Controlled by the "--format" option
+OUTPUT_FORMAT = "text"
+OUTPUT_FORMATS = frozenset({"text", "jsonl", "sarif"})
 
+# Controlled by the "--enable" and "--disable" options
+ENABLED_RULES: frozenset[str] | None = None  # None means all rules
+DISABLED_RULES: frozenset[str] = frozenset()
 
-def check(filenames: Sequence[str] = (), /) -> int:
+# Controlled by the "--timings" flag
+SHOW_TIMINGS = False
+# Number of calls to, and seconds spent in, each rule
+RULE_CALLS: Counter[str] = Counter()
+RULE_SECONDS: Counter[str] = Counter()
+# Email validation cache hits and misses in parallel worker processes
+WORKER_EMAIL_CACHE: Counter[str] = Counter()
+
+
+def check(filenames: Sequence[str] = (), /, *, jobs: int = 1, cache_file: Path | None = None) -> int:
     """The main entry-point."""
     if filenames:
-        filenames = map(Path, filenames)
+        filenames = [Path(filename).resolve() for filename in filenames]
     else:
-        filenames = PEP_ROOT.glob("pep-????.rst")
-    if (count := sum(map(check_file, filenames))) > 0:
+        filenames = _all_peps()
+
+    # Clean results only hold when every rule was run
+    if ENABLED_RULES is not None or DISABLED_RULES:
+        cache_file = None
+
+    # Skip PEPs whose contents have not changed since they were last clean
+    clean = _read_cache(cache_file) if cache_file is not None else {}
+    digests = {filename: _content_digest(filename) for filename in filenames}
+    filenames = [
+        filename for filename, digest in digests.items()
+        if digest is None or clean.get(str(filename)) != digest
+    ]
+
+    sarif_log = _begin_output()
+    count = 0
+    for filename, err_count in zip(filenames, _check_files(filenames, jobs, sarif_log)):
+        count += err_count
+        if err_count == 0:
+            clean[str(filename)] = digests[filename]
+        else:
+            clean.pop(str(filename), None)
+    if cache_file is not None:
+        _write_cache(cache_file, clean)
+    _end_output(sarif_log)
+    if SHOW_TIMINGS:
+        _output_timings()
+    if DETAILED_ERRORS:
+        _output_email_cache_info()
+
+    if count > 0:
         s = "s" * (count != 1)
         print(f"check-peps failed: {count} error{s}", file=sys.stderr)
         return 1
     return 0
 
 
-def check_file(filename: Path, /) -> int:
+def _all_peps() -> list[Path]:
+    return sorted(path for path in PEP_ROOT.glob("pep-????.rst") if path.name not in GENERATED_PEPS)
+
+
+def _check_files(filenames: Sequence[Path], jobs: int, sarif_log: _SarifLog | None = None) -> Iterator[int]:
+    """Check each PEP, yielding error counts in order."""
+    jobs = min(jobs, len(filenames), os.cpu_count() or 1)
+    if jobs <= 1:
+        for filename in filenames:
+            yield check_file(filename, sarif_log)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    settings = {
+        "DETAILED_ERRORS": DETAILED_ERRORS,
+        "ENABLED_RULES": ENABLED_RULES,
+        "DISABLED_RULES": DISABLED_RULES,
+        "SHOW_TIMINGS": SHOW_TIMINGS,
+    }
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(settings,)) as executor:
+        chunksize = max(1, len(filenames) // (jobs * 4))
+        # Errors are output in the parent process to keep them in order
+        results = executor.map(_check_file_worker, filenames, chunksize=chunksize)
+        for filename, (content, errors, calls, seconds, email_cache) in zip(filenames, results):
+            RULE_CALLS.update(calls)
+            RULE_SECONDS.update(seconds)
+            WORKER_EMAIL_CACHE.update(email_cache)
+            yield _output_error(filename, content, errors, sarif_log)
+
+
+def _init_worker(settings: dict[str, object]) -> None:
+    globals().update(settings)
+
+
+def _check_file_worker(filename: Path, /) -> tuple[str, list[RuleMessage], Counter[str], Counter[str], dict[str, int]]:
+    RULE_CALLS.clear()
+    RULE_SECONDS.clear()
+    cache_before = _email_errors.cache_info()
+    content, errors = _check_file(filename)
+    errors = list(errors)
+    cache_after = _email_errors.cache_info()
+    email_cache = {
+        "hits": cache_after.hits - cache_before.hits,
+        "misses": cache_after.misses - cache_before.misses,
+    }
+    # The contents are only needed to show lines with errors
+    if not errors or not DETAILED_ERRORS:
+        content = ""
+    # Copied, as results are pickled in chunks after the next file is checked
+    return content, errors, Counter(RULE_CALLS), Counter(RULE_SECONDS), email_cache
+
+
+def check_file(filename: Path, /, sarif_log: _SarifLog | None = None) -> int:
     filename = filename.resolve()
+    content, errors = _check_file(filename)
+    return _output_error(filename, content, errors, sarif_log)
+
+
+def _check_file(filename: Path, /) -> tuple[str, Iterable[RuleMessage]]:
     try:
         content = filename.read_text(encoding="utf-8")
     except FileNotFoundError:
-        return _output_error(filename, [""], [(0, "Could not read PEP!")])
+        return "", [("file-unreadable", 0, "Could not read PEP!")]
     else:
-        lines = content.splitlines()
-        return _output_error(filename, lines, check_peps(filename, lines))
+        return content, _check_text(filename, content)
 
 
-def check_peps(filename: Path, lines: Sequence[str], /) -> MessageIterator:
-    yield from check_headers(lines)
-    for line_num, line in enumerate(lines, start=1):
-        if filename.stem.removeprefix("pep-") in SKIP_DIRECT_PEP_LINK_CHECK:
+def watch(filenames: Sequence[str] = (), /) -> int:
+    """Re-check PEPs whenever they are modified, until interrupted."""
+    paths = [Path(filename).resolve() for filename in filenames]
+    mtimes: dict[Path, int] = {}
+    errors: dict[Path, list[RuleMessage]] = {}
+
+    # Report all current errors first
+    for filename in _modified_files(paths, mtimes):
+        content, file_errors = _check_file(filename)
+        errors[filename] = list(file_errors)
+        _output_error(filename, content, errors[filename])
+    print("Watching for changes. Press Ctrl+C to stop.", file=sys.stderr)
+
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            for filename in _modified_files(paths, mtimes):
+                _report_changes(filename, errors)
+    except KeyboardInterrupt:
+        return 0
+
+
+def _modified_files(paths: Sequence[Path], mtimes: dict[Path, int]) -> list[Path]:
+    """Find PEPs which were modified, created, or removed since the last call."""
+    current = {}
+    if paths:
+        for filename in paths:
+            try:
+                current[filename] = filename.stat().st_mtime_ns
+            except OSError:
+                pass
+    else:
+        # Watch the directory, so that new PEPs are found too
+        with os.scandir(PEP_ROOT) as entries:
+            for entry in entries:
+                if PEP_FILENAME_PATTERN.fullmatch(entry.name) and entry.name not in GENERATED_PEPS:
+                    try:
+                        current[Path(entry.path)] = entry.stat().st_mtime_ns
+                    except OSError:
+                        pass  # removed or renamed since the directory was listed
+
+    modified = [filename for filename, mtime in current.items() if mtimes.get(filename) != mtime]
+    modified += [filename for filename in mtimes.keys() - current.keys()]
+    mtimes.clear()
+    mtimes |= current
+    return sorted(modified)
+
+
+def _report_changes(filename: Path, errors: dict[Path, list[RuleMessage]]) -> None:
+    """Re-check a PEP and print the errors introduced and fixed since the last check."""
+    started = time.perf_counter()
+    if filename.is_file():
+        _content, new_errors = _check_file(filename)
+        new_errors = list(new_errors)
+    else:
+        new_errors = []
+    old_errors = errors.get(filename, [])
+    errors[filename] = new_errors
+
+    added = _error_difference(new_errors, old_errors)
+    fixed = _error_difference(old_errors, new_errors)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    relative_filename = filename.relative_to(ROOT_DIR)
+    print(f"{relative_filename}: {len(added)} new, {len(fixed)} fixed ({elapsed:.0f} ms)")
+    for sign, changed in ("+", added), ("-", fixed):
+        for _rule, line_num, msg in changed:
+            print(f"{sign} {relative_filename}:{line_num}:  {msg}")
+    sys.stdout.flush()
+
+
+def _error_difference(errors: Sequence[RuleMessage], other: Sequence[RuleMessage]) -> list[RuleMessage]:
+    """Errors not in other, ignoring line numbers (which move as lines are edited)."""
+    remaining = Counter((rule, msg) for rule, _line_num, msg in other)
+    difference = []
+    for error in errors:
+        key = error[0], error[2]
+        if remaining[key] > 0:
+            remaining[key] -= 1
+        else:
+            difference.append(error)
+    return difference
+
+
+def check_graph(filenames: Sequence[str] = (), /) -> int:
+    """Check the references between PEPs, for "--graph".
+
+    Every PEP is read to build the graph, but only errors in the given
+    PEPs (or in all PEPs, if none are given) are reported.
+    """
+    all_filenames = _all_peps()
+    filenames = [Path(filename).resolve() for filename in filenames] or all_filenames
+
+    started = time.perf_counter()
+    graph: dict[int, References] = {}
+    contents: dict[int, str] = {}
+    for filename in dict.fromkeys([*all_filenames, *filenames]):
+        pep_number = filename.stem.removeprefix("pep-")
+        if _is_digits(pep_number):
+            contents[int(pep_number)], graph[int(pep_number)] = _read_references(filename)
+    errors: dict[int, list[RuleMessage]] = {}
+    for pep_number, rule, line_num, msg in _check_references(graph):
+        if _rule_enabled(rule):
+            errors.setdefault(pep_number, []).append((rule, line_num, msg))
+    _record_timing("graph", started)
+
+    sarif_log = _begin_output()
+    count = 0
+    for filename in filenames:
+        pep_number = filename.stem.removeprefix("pep-")
+        if pep_errors := errors.get(int(pep_number) if _is_digits(pep_number) else -1):
+            pep_errors.sort(key=lambda error: error[1])
+            count += _output_error(filename, contents[int(pep_number)], pep_errors, sarif_log)
+    _end_output(sarif_log)
+    if SHOW_TIMINGS:
+        _output_timings()
+
+    if count > 0:
+        s = "s" * (count != 1)
+        print(f"check-peps failed: {count} error{s}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _read_references(filename: Path) -> tuple[str, References]:
+    """Read the header lines of a PEP, and the PEP numbers in each reference header."""
+    try:
+        lines = read_header_lines(filename)
+    except (OSError, UnicodeDecodeError):
+        return "", {}
+    references = {}
+    for header in tokenize_headers(lines):
+        if header.name in REFERENCE_HEADERS and header.name not in references:
+            # Malformed references are reported by the "header-*" rules
+            numbers = [int(ref) for ref in header.value.replace(",", " ").split() if _is_digits(ref)]
+            references[header.name] = header.line_num, numbers
+    return "\n".join(lines), references
+
+
+def _check_references(graph: Mapping[int, References], /) -> Iterator[tuple[int, str, int, str]]:
+    """Check references between PEPs, yielding (PEP number, rule, line number, message)."""
+    for pep_number, references in graph.items():
+        for header, (line_num, numbers) in references.items():
+            back_link = BACK_LINK_HEADERS.get(header)
+            for number in numbers:
+                if number not in graph:
+                    msg = f"{header} must only reference existing PEPs: PEP {number} does not exist"
+                    yield pep_number, "graph-dangling-reference", line_num, msg
+                elif back_link is not None and pep_number not in graph[number].get(back_link, (0, ()))[1]:
+                    msg = f"{header} references PEP {number}, whose {back_link} header must reference this PEP"
+                    yield pep_number, f"graph-missing-{back_link.lower()}", line_num, msg
+
+    for header in REFERENCE_HEADERS:
+        for cycle in _reference_cycles(graph, header):
+            # Reported once, by the lowest-numbered PEP in the cycle
+            line_num = graph[cycle[0]][header][0]
+            msg = f"{header} must not form a cycle: PEPs {', '.join(map(str, cycle))}"
+            yield cycle[0], "graph-cycle", line_num, msg
+
+
+def _reference_cycles(graph: Mapping[int, References], header: str) -> list[list[int]]:
+    """Find cycles of references in a header, as sorted lists of PEP numbers.
+
+    Each cycle is a strongly connected component of the graph, found
+    with an iterative form of Tarjan's algorithm in linear time.
+    """
+    edges = {
+        pep_number: [number for number in references[header][1] if number in graph]
+        for pep_number, references in graph.items() if header in references
+    }
+    index: dict[int, int] = {}
+    low_link: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    cycles = []
+    for root in edges:
+        if root in index:
             continue
-        yield from check_direct_links(line_num, line.lstrip())
+        index[root] = low_link[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low_link[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges.get(child, ()))))
+                    break
+                if child in on_stack:
+                    low_link[node] = min(low_link[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] == index[node]:
+                    component = []
+                    while (member := stack.pop()) != node:
+                        on_stack.remove(member)
+                        component.append(member)
+                    on_stack.remove(node)
+                    component.append(node)
+                    if len(component) > 1 or node in edges.get(node, ()):
+                        cycles.append(sorted(component))
+    return cycles
+
+
+def check_peps(filename: Path, lines: Sequence[str], /) -> MessageIterator:
+    yield from check_text(filename, "\n".join(lines))
+
+
+def check_text(filename: Path, text: str, /) -> MessageIterator:
+    """Check the contents of a PEP, with lines separated by newlines.
+
+    Only the header block is split into lines. The body is searched for
+    direct links in one pass, and line numbers are computed for matches.
+    """
+    for _rule, line_num, msg in _check_text(filename, text):
+        yield line_num, msg
+
+
+def _check_text(filename: Path, text: str, /) -> RuleMessageIterator:
+    for error in _check_headers(header_lines(text)):
+        if _rule_enabled(error[0]):
+            yield error
+    if filename.stem.removeprefix("pep-") in SKIP_DIRECT_PEP_LINK_CHECK:
+        return
+    if _rule_enabled("direct-pep-link") or _rule_enabled("direct-rfc-link"):
+        # Both kinds of link are found in the same search
+        started = time.perf_counter()
+        errors = list(_check_direct_links_text(text))
+        _record_timing("direct-links", started)
+        for error in errors:
+            if _rule_enabled(error[0]):
+                yield error
+
+
+def _rule_enabled(rule: str) -> bool:
+    if rule in DISABLED_RULES:
+        return False
+    return ENABLED_RULES is None or rule in ENABLED_RULES
+
+
+def _run_rule(rule: str, messages: Iterable[Message]) -> RuleMessageIterator:
+    """Run a rule if it is enabled, tagging its messages with the rule id."""
+    if not _rule_enabled(rule):
+        return
+    if SHOW_TIMINGS:
+        started = time.perf_counter()
+        messages = list(messages)
+        _record_timing(rule, started)
+    for line_num, msg in messages:
+        yield rule, line_num, msg
+
+
+def _record_timing(rule: str, started: float) -> None:
+    if not SHOW_TIMINGS:
+        return
+    RULE_CALLS[rule] += 1
+    RULE_SECONDS[rule] += time.perf_counter() - started
 
 
 def check_headers(lines: Sequence[str], /) -> MessageIterator:
-    yield from _validate_pep_number(next(iter(lines), ""))
+    for _rule, line_num, msg in _check_headers(lines):
+        yield line_num, msg
+
+
+def _check_headers(lines: Sequence[str], /) -> RuleMessageIterator:
+    yield from _run_rule("header-pep", _validate_pep_number(next(iter(lines), "")))
 
+    headers = tokenize_headers(lines)
     found_headers = {}
-    found_header_lines: list[tuple[str, int]] = []
-    line_num = 0
-    for line_num, line in enumerate(lines, start=1):
-        if line.strip() == "":
-            headers_end_line_num = line_num
-            break
-        if match := HEADER_PATTERN.match(line):
-            header = match[1]
-            found_header_lines.append((header, line_num))
-            if header in ALL_HEADERS:
-                if header not in found_headers:
-                    found_headers[header] = None
-                else:
-                    yield line_num, f"Must not have duplicate header: {header} "
+    for header in headers:
+        if header.name in ALL_HEADERS:
+            if header.name not in found_headers:
+                found_headers[header.name] = None
             else:
-                yield line_num, f"Must not have invalid header: {header}"
-    else:
-        headers_end_line_num = line_num
+                yield "header-duplicate", header.line_num, f"Must not have duplicate header: {header.name} "
+        else:
+            yield "header-invalid", header.line_num, f"Must not have invalid header: {header.name}"
 
-    yield from _validate_required_headers(found_headers.keys())
+    yield from _run_rule("header-required", _validate_present_headers(found_headers.keys()))
+    yield from _run_rule("header-order", _validate_header_order(found_headers.keys()))
 
-    shifted_line_nums = [line for _, line in found_header_lines[1:]]
-    for i, (header, line_num) in enumerate(found_header_lines):
-        start = line_num - 1
-        end = headers_end_line_num - 1
-        if i < len(found_header_lines) - 1:
-            end = shifted_line_nums[i] - 1
-        remainder = "\n".join(lines[start:end]).removeprefix(f"{header}:")
-        if remainder != "":
-            if remainder[0] not in {" ", "\n"}:
-                yield line_num, f"Headers must have a space after the colon: {header}"
-            remainder = remainder.lstrip()
-        yield from _validate_header(header, line_num, remainder)
+    for header in headers:
+        after_colon = lines[header.line_num - 1][len(header.name) + 1:]
+        if after_colon != "" and after_colon[0] != " ":
+            yield "header-colon-space", header.line_num, f"Headers must have a space after the colon: {header.name}"
+        if header.name in HEADER_VALIDATORS:
+            rule = f"header-{header.name.lower()}"
+            yield from _run_rule(rule, _validate_header(header.name, header.line_num, header.value.lstrip()))
 
 
 def _validate_header(header: str, line_num: int, content: str) -> MessageIterator:
-    if header == "Title":
-        yield from _validate_title(line_num, content)
-    elif header == "Author":
-        yield from _validate_author(line_num, content)
-    elif header == "Sponsor":
-        yield from _validate_sponsor(line_num, content)
-    elif header in {"BDFL-Delegate", "PEP-Delegate"}:
-        yield from _validate_delegate(line_num, content)
-    elif header == "Discussions-To":
-        yield from _validate_discussions_to(line_num, content)
-    elif header == "Status":
-        yield from _validate_status(line_num, content)
-    elif header == "Type":
-        yield from _validate_type(line_num, content)
-    elif header == "Topic":
-        yield from _validate_topic(line_num, content)
-    elif header in {"Requires", "Replaces", "Superseded-By"}:
-        yield from _validate_pep_references(line_num, content)
-    elif header == "Created":
-        yield from _validate_created(line_num, content)
-    elif header == "Python-Version":
-        yield from _validate_python_version(line_num, content)
-    elif header == "Post-History":
-        yield from _validate_post_history(line_num, content)
-    elif header == "Resolution":
-        yield from _validate_resolution(line_num, content)
+    if (validator := HEADER_VALIDATORS.get(header)) is not None:
+        yield from validator(line_num, content)
 
 
 def check_direct_links(line_num: int, line: str) -> MessageIterator:
     """Check that PEPs and RFCs aren't linked directly"""
 
-    line = line.lower()
-    if "dev/peps/pep-" in line or "peps.python.org/pep-" in line:
-        yield line_num, "Use the :pep:`NNN` role to refer to PEPs"
-    if "rfc-editor.org/rfc/" in line or "ietf.org/doc/html/rfc" in line:
-        yield line_num, "Use the :rfc:`NNN` role to refer to RFCs"
+    kinds = {match[0][:3] for match in DIRECT_LINK_PATTERN.finditer(line.lower())}
+    for _rule, line_num, msg in _direct_link_messages(line_num, kinds):
+        yield line_num, msg
 
 
-def _output_error(filename: Path, lines: Sequence[str], errors: Iterable[Message]) -> int:
+def _check_direct_links_text(text: str) -> RuleMessageIterator:
+    # Reported once per kind per line, in line order
+    found: dict[int, set[str]] = {}
+    line_num = 1
+    pos = 0
+    text = text.lower()
+    for match in DIRECT_LINK_PATTERN.finditer(text):
+        line_num += text.count("\n", pos, match.start())
+        pos = match.start()
+        found.setdefault(line_num, set()).add(match[0][:3])
+    for line_num, kinds in found.items():
+        yield from _direct_link_messages(line_num, kinds)
+
+
+def _direct_link_messages(line_num: int, kinds: set[str]) -> RuleMessageIterator:
+    if "pep" in kinds:
+        yield "direct-pep-link", line_num, "Use the :pep:`NNN` role to refer to PEPs"
+    if "rfc" in kinds:
+        yield "direct-rfc-link", line_num, "Use the :rfc:`NNN` role to refer to RFCs"
+
+
+def _output_error(
+    filename: Path, content: str, errors: Iterable[RuleMessage], sarif_log: _SarifLog | None = None
+) -> int:
+    """Output errors in the chosen format, returning the number of errors.
+
+    For "--format sarif", ``sarif_log`` is the log begun by _begin_output().
+    """
     relative_filename = filename.relative_to(ROOT_DIR)
+    lines = None
     err_count = 0
-    for line_num, msg in errors:
+    for rule, line_num, msg in errors:
         err_count += 1
 
-        print(f"{relative_filename}:{line_num}:  {msg}")
-        if not DETAILED_ERRORS:
-            continue
+        line = None
+        if DETAILED_ERRORS:
+            if lines is None:
+                lines = content.split("\n")
+            line = lines[line_num - 1]
 
-        line = lines[line_num - 1]
-        print("     |")
-        print(f"{line_num: >4} | '{line}'")
-        print("     |")
+        if OUTPUT_FORMAT == "jsonl":
+            _output_jsonl(relative_filename, rule, line_num, msg, line)
+        elif OUTPUT_FORMAT == "sarif":
+            sarif_log.write_result(relative_filename, rule, line_num, msg, line)
+        else:
+            print(f"{relative_filename}:{line_num}:  {msg}")
+            if line is not None:
+                print("     |")
+                print(f"{line_num: >4} | '{line}'")
+                print("     |")
 
     return err_count
 
 
+def _output_timings() -> None:
+    print(f"{'Rule':<24} {'Calls':>7} {'Total ms':>10} {'Mean µs':>9}", file=sys.stderr)
+    for rule, seconds in RULE_SECONDS.most_common():
+        calls = RULE_CALLS[rule]
+        print(f"{rule:<24} {calls:>7} {seconds * 1000:>10.2f} {seconds / calls * 1e6:>9.1f}", file=sys.stderr)
+
+
+def _output_email_cache_info() -> None:
+    cache_info = _email_errors.cache_info()
+    hits = cache_info.hits + WORKER_EMAIL_CACHE["hits"]
+    misses = cache_info.misses + WORKER_EMAIL_CACHE["misses"]
+    print(f"Email validation cache: {hits} hits, {misses} misses", file=sys.stderr)
+
+
+def _begin_output() -> _SarifLog | None:
+    """Start the output of a run, returning the SARIF log for "--format sarif"."""
+    if OUTPUT_FORMAT == "sarif":
+        return _SarifLog()
+    return None
+
+
+def _end_output(sarif_log: _SarifLog | None) -> None:
+    if sarif_log is not None:
+        sarif_log.close()
+
+
+def _output_jsonl(filename: Path, rule: str, line_num: int, msg: str, line: str | None) -> None:
+    record = {"file": filename.as_posix(), "line": line_num, "rule": rule, "message": msg}
+    if line is not None:
+        record["source"] = line
+    print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+# A SARIF log is one JSON document, so it is written in three parts:
+# everything before the results, each result, and everything after them
+_SARIF_PREFIX, _SARIF_SUFFIX = json.dumps({
+    "version": "2.1.0",
+    "$schema": SARIF_SCHEMA,
+    "runs": [{
+        "tool": {"driver": {"name": "check-peps", "informationUri": "https://peps.python.org/pep-0001/"}},
+        "results": [],
+    }],
+}).rsplit("[]", 1)
+_SARIF_PREFIX += "["
+_SARIF_SUFFIX = "\n]" + _SARIF_SUFFIX
+
+
+class _SarifLog:
+    """A SARIF log being written, with each result written as it is found."""
+
+    def __init__(self) -> None:
+        self.result_count = 0
+        print(_SARIF_PREFIX, end="", flush=True)
+
+    def write_result(self, filename: Path, rule: str, line_num: int, msg: str, line: str | None) -> None:
+        location = {"artifactLocation": {"uri": filename.as_posix()}}
+        if line_num > 0:
+            location["region"] = {"startLine": line_num}
+            if line is not None:
+                location["region"]["snippet"] = {"text": line}
+        result = {
+            "ruleId": rule,
+            "level": "error",
+            "message": {"text": msg},
+            "locations": [{"physicalLocation": location}],
+        }
+        # Results are written into the open "results" array as they are found
+        separator = "," * (self.result_count > 0)
+        self.result_count += 1
+        print(f"{separator}\n{json.dumps(result, ensure_ascii=False)}", end="", flush=True)
+
+    def close(self) -> None:
+        print(_SARIF_SUFFIX, flush=True)
+
+
+def _content_digest(filename: Path) -> str | None:
+    try:
+        return hashlib.sha256(filename.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _read_cache(cache_file: Path) -> dict[str, str]:
+    """Read the digests of clean PEPs, if recorded by this version of the checks."""
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("checker") != CHECKER_DIGEST:
+        return {}
+    clean = cache.get("clean")
+    return clean if isinstance(clean, dict) else {}
+
+
+def _write_cache(cache_file: Path, clean: dict[str, str]) -> None:
+    cache = {"checker": CHECKER_DIGEST, "clean": clean}
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(json.dumps(cache, indent=0, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is only an optimisation
+        tmp_file.unlink(missing_ok=True)
+
+
 ###########################
 #  PEP Header Validators  #
 ###########################
 
+# Validators for the contents of each header, by header name.
+# Each is run as the rule "header-<name>", e.g. "header-post-history".
+HEADER_VALIDATORS: dict[str, Callable[[int, str], MessageIterator]] = {}
 
-def _validate_required_headers(found_headers: KeysView[str]) -> MessageIterator:
-    """PEPs must have all required headers, in the PEP 12 order"""
+
+def _header_validator(*headers: str) -> Callable:
+    """Register a function to validate the contents of the given headers."""
+    def register(validator: Callable[[int, str], MessageIterator]) -> Callable[[int, str], MessageIterator]:
+        for header in headers:
+            HEADER_VALIDATORS[header] = validator
+        return validator
+    return register
+
+
+def _validate_present_headers(found_headers: KeysView[str]) -> MessageIterator:
+    """PEPs must have all required headers"""
 
     if missing := REQUIRED_HEADERS.difference(found_headers):
         for missing_header in sorted(missing, key=ALL_HEADERS.index):
             yield 1, f"Must have required header: {missing_header}"
 
+
+def _validate_header_order(found_headers: KeysView[str]) -> MessageIterator:
+    """Headers must be in the PEP 12 order"""
+
     ordered_headers = sorted(found_headers, key=ALL_HEADERS.index)
     if list(found_headers) != ordered_headers:
         order_str = ", ".join(ordered_headers)
@@ -250,6 +794,7 @@ def _validate_pep_number(line: str) -> MessageIterator:
     yield from _pep_num(1, pep_number, "'PEP:' header")
 
 
+@_header_validator("Title")
 def _validate_title(line_num: int, line: str) -> MessageIterator:
     """'Title' must be 1-79 characters"""
 
@@ -259,6 +804,7 @@ def _validate_title(line_num: int, line: str) -> MessageIterator:
         yield line_num, "PEP title must be less than 80 characters"
 
 
+@_header_validator("Author")
 def _validate_author(line_num: int, body: str) -> MessageIterator:
     """'Author' must be list of 'Name <email@example.com>, …'"""
 
@@ -278,12 +824,14 @@ def _validate_author(line_num: int, body: str) -> MessageIterator:
             yield from _email(line_num + offset, part, "Author")
 
 
+@_header_validator("Sponsor")
 def _validate_sponsor(line_num: int, line: str) -> MessageIterator:
     """'Sponsor' must have format 'Name <email@example.com>'"""
 
     yield from _email(line_num, line, "Sponsor")
 
 
+@_header_validator("BDFL-Delegate", "PEP-Delegate")
 def _validate_delegate(line_num: int, line: str) -> MessageIterator:
     """'Delegate' must have format 'Name <email@example.com>'"""
 
@@ -299,6 +847,7 @@ def _validate_delegate(line_num: int, line: str) -> MessageIterator:
     yield from _email(line_num, line, "Delegate")
 
 
+@_header_validator("Discussions-To")
 def _validate_discussions_to(line_num: int, line: str) -> MessageIterator:
     """'Discussions-To' must be a thread URL"""
 
@@ -310,12 +859,13 @@ def _validate_discussions_to(line_num: int, line: str) -> MessageIterator:
     for suffix in "@python.org", "@googlegroups.com":
         if line.endswith(suffix):
             remainder = line.removesuffix(suffix)
-            if re.fullmatch(r"[\w\-]+", remainder) is None:
+            if MAILING_LIST_NAME_PATTERN.fullmatch(remainder) is None:
                 yield line_num, "Discussions-To must be a valid mailing list"
             return
     yield line_num, "Discussions-To must be a valid thread URL, mailing list, or 'Pending'"
 
 
+@_header_validator("Status")
 def _validate_status(line_num: int, line: str) -> MessageIterator:
     """'Status' must be a valid PEP status"""
 
@@ -323,6 +873,7 @@ def _validate_status(line_num: int, line: str) -> MessageIterator:
         yield line_num, "Status must be a valid PEP status"
 
 
+@_header_validator("Type")
 def _validate_type(line_num: int, line: str) -> MessageIterator:
     """'Type' must be a valid PEP type"""
 
@@ -330,6 +881,7 @@ def _validate_type(line_num: int, line: str) -> MessageIterator:
         yield line_num, "Type must be a valid PEP type"
 
 
+@_header_validator("Topic")
 def _validate_topic(line_num: int, line: str) -> MessageIterator:
     """'Topic' must be for a valid sub-index"""
 
@@ -347,6 +899,7 @@ def _validate_topic(line_num: int, line: str) -> MessageIterator:
         yield line_num, "Topic must be sorted lexicographically"
 
 
+@_header_validator("Requires", "Replaces", "Superseded-By")
 def _validate_pep_references(line_num: int, line: str) -> MessageIterator:
     """`Requires`/`Replaces`/`Superseded-By` must be 'NNN' PEP IDs"""
 
@@ -360,12 +913,14 @@ def _validate_pep_references(line_num: int, line: str) -> MessageIterator:
         yield from _pep_num(line_num, reference, "PEP reference")
 
 
+@_header_validator("Created")
 def _validate_created(line_num: int, line: str) -> MessageIterator:
     """'Created' must be a 'DD-mmm-YYYY' date"""
 
     yield from _date(line_num, line, "Created")
 
 
+@_header_validator("Python-Version")
 def _validate_python_version(line_num: int, line: str) -> MessageIterator:
     """'Python-Version' must be an ``X.Y[.Z]`` version"""
 
@@ -398,6 +953,7 @@ def _validate_python_version(line_num: int, line: str) -> MessageIterator:
             yield line_num, f"Python-Version micro part must be numeric: {version}"
 
 
+@_header_validator("Post-History")
 def _validate_post_history(line_num: int, body: str) -> MessageIterator:
     """'Post-History' must be '`DD-mmm-YYYY <Thread URL>`__, …' or `DD-mmm-YYYY`"""
 
@@ -417,6 +973,7 @@ def _validate_post_history(line_num: int, body: str) -> MessageIterator:
                 yield offset, "post line must be a date or both start with “`” and end with “>`__”, or 'Pending'"
 
 
+@_header_validator("Resolution")
 def _validate_resolution(line_num: int, line: str) -> MessageIterator:
     """'Resolution' must be a direct thread/message URL or a link with a date."""
 
@@ -454,32 +1011,34 @@ def _is_digits(string: str) -> bool:
 
 
 def _email(line_num: int, author_email: str, prefix: str) -> MessageIterator:
-    author_email = author_email.strip()
+    for msg in _email_errors(author_email.strip(), prefix):
+        yield line_num, msg
+
+
+# Memoised, as prolific authors' entries are repeated across many PEPs
+@functools.lru_cache(maxsize=4096)
+def _email_errors(author_email: str, prefix: str) -> tuple[str, ...]:
+    errors = []
 
     if author_email.count("<") > 1:
-        msg = f"{prefix} entries must not contain multiple '<': {author_email!r}"
-        yield line_num, msg
+        errors.append(f"{prefix} entries must not contain multiple '<': {author_email!r}")
     if author_email.count(">") > 1:
-        msg = f"{prefix} entries must not contain multiple '>': {author_email!r}"
-        yield line_num, msg
+        errors.append(f"{prefix} entries must not contain multiple '>': {author_email!r}")
     if author_email.count("@") > 1:
-        msg = f"{prefix} entries must not contain multiple '@': {author_email!r}"
-        yield line_num, msg
+        errors.append(f"{prefix} entries must not contain multiple '@': {author_email!r}")
 
     author = author_email.split("<", 1)[0].rstrip()
     if NAME_PATTERN.fullmatch(author) is None:
-        msg = f"{prefix} entries must begin with a valid 'Name': {author_email!r}"
-        yield line_num, msg
-        return
+        errors.append(f"{prefix} entries must begin with a valid 'Name': {author_email!r}")
+        return tuple(errors)
 
     email_text = author_email.removeprefix(author)
     if not email_text:
         # Does not have the optional email part
-        return
+        return tuple(errors)
 
     if not email_text.startswith(" <") or not email_text.endswith(">"):
-        msg = f"{prefix} entries must be formatted as 'Name <email@example.com>': {author_email!r}"
-        yield line_num, msg
+        errors.append(f"{prefix} entries must be formatted as 'Name <email@example.com>': {author_email!r}")
     email_text = email_text.removeprefix(" <").removesuffix(">")
 
     if "@" in email_text:
@@ -487,10 +1046,11 @@ def _email(line_num: int, author_email: str, prefix: str) -> MessageIterator:
     elif " at " in email_text:
         local, domain = email_text.rsplit(" at ", 1)
     else:
-        yield line_num, f"{prefix} entries must contain a valid email address: {author_email!r}"
-        return
+        errors.append(f"{prefix} entries must contain a valid email address: {author_email!r}")
+        return tuple(errors)
     if EMAIL_LOCAL_PART_PATTERN.fullmatch(local) is None or _invalid_domain(domain):
-        yield line_num, f"{prefix} entries must contain a valid email address: {author_email!r}"
+        errors.append(f"{prefix} entries must contain a valid email address: {author_email!r}")
+    return tuple(errors)
 
 
 def _invalid_domain(domain_part: str) -> bool:
@@ -513,66 +1073,23 @@ def _thread(line_num: int, url: str, prefix: str, *, allow_message: bool = False
             yield line_num, msg
         return
 
-    if url.startswith("https://discuss.python.org/t/"):
-        remainder = url.removeprefix("https://discuss.python.org/t/").removesuffix("/")
-
-        # Discussions-To links must be the thread itself, not a post
-        if discussions_to:
-            # The equivalent pattern is similar to '([\w\-]+/)?\d+',
-            # but the topic name must contain a non-numeric character
-
-            # We use ``str.rpartition`` as the topic name is optional
-            topic_name, _, topic_id = remainder.rpartition("/")
-            if topic_name == '' and _is_digits(topic_id):
-                return
-            topic_name = topic_name.replace("-", "0").replace("_", "0")
-            # the topic name must not be entirely numeric
-            valid_topic_name = not _is_digits(topic_name) and topic_name.isalnum()
-            if valid_topic_name and _is_digits(topic_id):
-                return
-        else:
-            # The equivalent pattern is similar to '([\w\-]+/)?\d+(/\d+)?',
-            # but the topic name must contain a non-numeric character
-            if remainder.count("/") == 2:
-                # When there are three parts, the URL must be "topic-name/topic-id/post-id".
-                topic_name, topic_id, post_id = remainder.rsplit("/", 2)
-                topic_name = topic_name.replace("-", "0").replace("_", "0")
-                valid_topic_name = not _is_digits(topic_name) and topic_name.isalnum()
-                if valid_topic_name and _is_digits(topic_id) and _is_digits(post_id):
-                    # the topic name must not be entirely numeric
-                    return
-            elif remainder.count("/") == 1:
-                # When there are only two parts, there's an ambiguity between
-                # "topic-name/topic-id" and "topic-id/post-id".
-                # We disambiguate by checking if the LHS is a valid name and
-                # the RHS is a valid topic ID (for the former),
-                # and then if both the LHS and RHS are valid IDs (for the latter).
-                left, right = remainder.rsplit("/")
-                left = left.replace("-", "0").replace("_", "0")
-                # the topic name must not be entirely numeric
-                left_is_name = not _is_digits(left) and left.isalnum()
-                if left_is_name and _is_digits(right):
-                    return
-                elif _is_digits(left) and _is_digits(right):
-                    return
-            else:
-                # When there's only one part, it must be a valid topic ID.
-                if _is_digits(remainder):
-                    return
+    thread_url = classify_thread_url(url)
+    if thread_url is None or not _is_thread_link(thread_url, allow_message, discussions_to):
+        yield line_num, msg
 
-    if url.startswith("https://mail.python.org/pipermail/"):
-        remainder = url.removeprefix("https://mail.python.org/pipermail/")
-        if MAILMAN_2_PATTERN.fullmatch(remainder) is not None:
-            return
 
-    if url.startswith("https://mail.python.org/archives/list/"):
-        remainder = url.removeprefix("https://mail.python.org/archives/list/")
-        if allow_message and MAILMAN_3_MESSAGE_PATTERN.fullmatch(remainder) is not None:
-            return
-        if MAILMAN_3_THREAD_PATTERN.fullmatch(remainder) is not None:
-            return
-
-    yield line_num, msg
+def _is_thread_link(thread_url: ThreadURL, allow_message: bool, discussions_to: bool) -> bool:
+    if thread_url.item_type == "thread":
+        return True
+    if thread_url.item_type != "message":
+        return False
+    if thread_url.host == "discourse":
+        # Discussions-To links must be the thread itself, not a post
+        return not discussions_to
+    if thread_url.host == "pipermail":
+        # Pipermail has no thread pages, so messages are always allowed
+        return True
+    return allow_message
 
 
 def _date(line_num: int, date_str: str, prefix: str) -> MessageIterator:
@@ -592,18 +1109,83 @@ def _date(line_num: int, date_str: str, prefix: str) -> MessageIterator:
         yield line_num, f"{prefix} must not be in the future: {date_str!r}"
 
 
+def all_rules() -> frozenset[str]:
+    """The ids of all rules, for "--enable" and "--disable"."""
+    return frozenset({
+        "file-unreadable",
+        "header-pep",
+        "header-duplicate",
+        "header-invalid",
+        "header-required",
+        "header-order",
+        "header-colon-space",
+        "direct-pep-link",
+        "direct-rfc-link",
+        "graph-dangling-reference",
+        "graph-missing-replaces",
+        "graph-missing-superseded-by",
+        "graph-cycle",
+        *(f"header-{header.lower()}" for header in HEADER_VALIDATORS),
+    })
+
+
 if __name__ == "__main__":
     if {"-h", "--help", "-?"}.intersection(sys.argv[1:]):
         print(__doc__, file=sys.stderr)
         raise SystemExit(0)
 
     files = {}
-    for arg in sys.argv[1:]:
+    jobs = 1
+    cache_file = CACHE_FILE
+    watch_mode = False
+    graph_mode = False
+    args = iter(sys.argv[1:])
+    for arg in args:
         if not arg.startswith("-"):
             files[arg] = None
         elif arg in {"-d", "--detailed"}:
             DETAILED_ERRORS = True
+        elif arg in {"-j", "--jobs"} or arg.startswith("--jobs="):
+            value = arg.removeprefix("--jobs=") if "=" in arg else next(args, "")
+            if not _is_digits(value) or int(value) < 1:
+                print(f"Invalid number of jobs: {value!r}", file=sys.stderr)
+                raise SystemExit(1)
+            jobs = int(value)
+        elif arg == "--no-cache":
+            cache_file = None
+        elif arg == "--watch":
+            watch_mode = True
+        elif arg == "--graph":
+            graph_mode = True
+        elif arg == "--timings":
+            SHOW_TIMINGS = True
+        elif arg in {"--enable", "--disable"} or arg.startswith(("--enable=", "--disable=")):
+            option, _, value = arg.partition("=")
+            rules = frozenset(filter(None, (value or next(args, "")).split(",")))
+            if unknown := rules - all_rules():
+                print(f"Unknown rules for {option}: {', '.join(sorted(unknown))}", file=sys.stderr)
+                raise SystemExit(1)
+            if option == "--enable":
+                ENABLED_RULES = rules | (ENABLED_RULES or frozenset())
+            else:
+                DISABLED_RULES |= rules
+        elif arg == "--format" or arg.startswith("--format="):
+            value = arg.removeprefix("--format=") if "=" in arg else next(args, "")
+            if value not in OUTPUT_FORMATS:
+                print(f"Invalid output format: {value!r}", file=sys.stderr)
+                raise SystemExit(1)
+            OUTPUT_FORMAT = value
         else:
             print(f"Unknown option: {arg!r}", file=sys.stderr)
             raise SystemExit(1)
-    raise SystemExit(check(files))
+    if watch_mode:
+        if OUTPUT_FORMAT != "text":
+            print("--watch only supports text output", file=sys.stderr)
+            raise SystemExit(1)
+        if graph_mode:
+            print("--watch cannot be used with --graph", file=sys.stderr)
+            raise SystemExit(1)
+        raise SystemExit(watch(files))
+    if graph_mode:
+        raise SystemExit(check_graph(files))
+    raise SystemExit(check(files, jobs=jobs, cache_file=cache_file))
@@ -0,0 +1,5 @@
+"""Parsing of PEP metadata, shared by check-peps and the Sphinx extensions.
+
+This package must only use the standard library, as check-peps is run
+by pre-commit without any dependencies installed.
+"""
@@ -0,0 +1,80 @@
+"""Tokenizer for the RFC 2822 style header block at the start of PEPs."""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# any sequence of letters or '-', followed by a single ':' and a space or end of line
+HEADER_PATTERN = re.compile(r"^([a-z\-]+):(?: |$)", re.ASCII | re.IGNORECASE)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Header:
+    """A header from a PEP's header block."""
+    name: str  # The header name, as written.
+    value: str  # The text after the colon, with continuation lines joined by newlines.
+    line_num: int  # The line number of the header name.
+
+
+def tokenize_headers(lines: Iterable[str]) -> list[Header]:
+    """Split header lines into headers, stopping at the first blank line.
+
+    A header starts on a line matching ``HEADER_PATTERN``, and any other
+    lines continue the previous header. Lines before the first header are
+    ignored.
+
+    As with ``email.parser.HeaderParser``, leading spaces and tabs are
+    removed from the value on the first line, and continuation lines are
+    kept unchanged.
+    """
+    headers = []
+    name = None
+    value_lines: list[str] = []
+    line_num = 0
+    for num, line in enumerate(lines, start=1):
+        if line.strip() == "":
+            break
+        if match := HEADER_PATTERN.match(line):
+            if name is not None:
+                headers.append(Header(name, "\n".join(value_lines), line_num))
+            name = match[1]
+            value_lines = [line[len(name) + 1:].lstrip(" \t")]
+            line_num = num
+        elif name is not None:
+            value_lines.append(line)
+    if name is not None:
+        headers.append(Header(name, "\n".join(value_lines), line_num))
+    return headers
+
+
+def header_lines(text: str) -> list[str]:
+    """Split lines from the start of the text up to and including the first blank line."""
+    lines = []
+    start = 0
+    while (end := text.find("\n", start)) != -1:
+        line = text[start:end]
+        lines.append(line)
+        if line.strip() == "":
+            return lines
+        start = end + 1
+    if start < len(text):
+        lines.append(text[start:])
+    return lines
+
+
+def read_header_lines(filename: Path) -> list[str]:
+    """Read the header lines of a PEP, without reading the body."""
+    lines = []
+    with open(filename, encoding="utf-8") as pep_file:
+        for line in pep_file:
+            line = line.rstrip("\n")
+            if line.strip() == "":
+                break
+            lines.append(line)
+    return lines
@@ -0,0 +1,92 @@
+"""Classifier for links to Discourse threads and mailing list archives."""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+
+# Discourse topic names must contain a character that is not a digit, '-' or '_'
+_DISCOURSE_TOPIC_NAME = r"[\w\-]*[^\W0-9_][\w\-]*"
+
+# Each pattern matches a whole URL, and is tried in order.
+# Scheme and host are matched case-sensitively, and the remainder
+# of mailing list archive URLs case-insensitively (and ASCII-only).
+_THREAD_URL_PATTERNS = (
+    # https://discuss.python.org/t/<topic-name>/<topic-id>/<post-id>,
+    # where the topic name and post ID are optional
+    ("discourse", re.compile(
+        rf"https?://discuss\.python\.org/t/"
+        rf"(?:(?P<name>{_DISCOURSE_TOPIC_NAME})/)?(?P<thread>[0-9]+)(?:/(?P<post>[0-9]+))?/?"
+    )),
+    # https://discuss.python.org/c/<category>/...
+    ("discourse", re.compile(r"https?://discuss\.python\.org/c/(?P<category>[^/]+)(?:/.*)?")),
+    # https://mail.python.org/pipermail/<list-name>/<year>-<month>/<id>.html
+    ("pipermail", re.compile(
+        r"https?://mail\.python\.org/pipermail/"
+        r"(?ai:(?P<name>[\w\-]+)(?:/\d{4}-[a-z]+/(?P<post>\d+)\.html|/?))"
+    )),
+    # https://mail.python.org/archives/list/<list-name>@python.org/thread/<id>
+    # https://mail.python.org/archives/list/<list-name>@python.org/message/<id>
+    ("hyperkitty", re.compile(
+        r"https?://mail\.python\.org/archives/list/"
+        r"(?ai:(?P<name>[\w\-]+)@python\.org(?:"
+        r"/thread/(?P<thread>[a-z0-9]+)/?"
+        r"|/message/(?P<post>[a-z0-9]+)/?(?:#[a-z0-9]+)?"
+        r"|/?))"
+    )),
+    # https://mail.python.org/mailman3/lists/<list-name>.python.org/
+    ("mailman3", re.compile(r"https?://mail\.python\.org/mailman3/lists/(?ai:(?P<name>[\w\-]+)\.python\.org/?)")),
+    # https://mail.python.org/mailman/listinfo/<list-name>
+    ("listinfo", re.compile(r"https?://mail\.python\.org/mailman/listinfo/(?ai:(?P<name>[\w\-]+)/?)")),
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ThreadURL:
+    """A link to a Discourse thread or category, or a mailing list, thread or message."""
+    host: str  # "discourse", or the list archive: "pipermail", "hyperkitty", "mailman3" or "listinfo".
+    item_type: str  # "thread", "message" (a post), "category" or "list".
+    name: str  # The Discourse topic name or category, or the mailing list name.
+    thread_id: str | None = None
+    post_id: str | None = None
+
+    @property
+    def pretty_name(self) -> str:
+        """The name of the list or forum, such as 'Python-Dev' or 'PEPs Discourse'."""
+        if self.host != "discourse":
+            item_name = self.name
+        elif self.item_type == "category" and not self.name.isnumeric():
+            item_name = f"{self.name.replace('-', ' ')} discourse"
+        else:
+            item_name = "discourse"
+        return item_name.lower().title().replace("Sig", "SIG").replace("Pep", "PEP")
+
+    @property
+    def pretty_title(self) -> str:
+        """A short description of the link, such as 'Python-Dev thread'."""
+        return f"{self.pretty_name} {self.item_type}"
+
+
+def classify_thread_url(url: str) -> ThreadURL | None:
+    """Classify a link to Discourse or the python.org mailing lists.
+
+    Return None if the URL is not recognised.
+    """
+    for host, pattern in _THREAD_URL_PATTERNS:
+        if match := pattern.fullmatch(url):
+            break
+    else:
+        return None
+
+    groups = match.groupdict()
+    if "category" in groups:
+        return ThreadURL(host, "category", groups["category"])
+    thread_id = groups.get("thread")
+    post_id = groups.get("post")
+    if post_id is not None:
+        item_type = "message"
+    elif thread_id is not None:
+        item_type = "thread"
+    else:
+        item_type = "list"
+    return ThreadURL(host, item_type, groups["name"] or "", thread_id, post_id)
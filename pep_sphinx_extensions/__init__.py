@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import html
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from docutils.writers.html5_polyglot import HTMLTranslator
 from sphinx import environment
 
+from pep_sphinx_extensions import single_pep
 from pep_sphinx_extensions.generate_rss import (
+    FEED_METADATA,
     create_rss_feed,
-    get_from_doctree,
-    pep_abstract,
+    lookup_pep_metadata,
 )
 from pep_sphinx_extensions.pep_processor.html import (
     pep_html_builder,
@@ -23,6 +23,7 @@ from pep_sphinx_extensions.pep_processor.parsing import (
     pep_parser,
     pep_role,
 )
+from pep_sphinx_extensions.pep_processor.transforms import pep_footer
 from pep_sphinx_extensions.pep_processor.transforms import pep_references
 from pep_sphinx_extensions.pep_zero_generator.pep_index_generator import create_pep_zero
 
@@ -31,12 +32,17 @@ if TYPE_CHECKING:
 
 
 def _update_config_for_builder(app: Sphinx) -> None:
-    app.env.document_ids = {}  # For PEPReferenceRoleTitleText
     app.env.settings["builder"] = app.builder.name
     if app.builder.name == "dirhtml":
         app.env.settings["pep_url"] = "pep-{:0>4}/"
 
-    app.connect("build-finished", _post_build)  # Post-build tasks
+    # Look up last modified times once per build, before parallel readers are forked
+    pep_footer.last_modified_times.cache_clear()
+    pep_footer.last_modified_times()
+
+    # single_pep is set by "build.py --pep", which doesn't read the other PEPs
+    if "single_pep" not in app.tags:
+        app.connect("build-finished", _post_build)  # Post-build tasks
 
 
 def _post_build(app: Sphinx, exception: Exception | None) -> None:
@@ -50,7 +56,7 @@ def _post_build(app: Sphinx, exception: Exception | None) -> None:
     # internal_builder exists if Sphinx is run by build.py
     if "internal_builder" not in app.tags:
         create_index_file(Path(app.outdir), app.builder.name)
-    create_rss_feed(app.doctreedir, app.outdir)
+    create_rss_feed(app.doctreedir, app.outdir, FEED_METADATA.data(app.env))
 
 
 def set_description(
@@ -59,8 +65,8 @@ def set_description(
     if not pagename.startswith("pep-"):
         return
 
-    full_path = Path(app.doctreedir) / f"{pagename}.doctree"
-    abstract = get_from_doctree(full_path, "Abstract")
+    # Use the abstract recorded at read time, or the doctree we already have
+    abstract = lookup_pep_metadata(app.env, pagename, doctree).get("Abstract")
     if abstract:
         if len(abstract) > 256:
             abstract = abstract[:253] + "..."
@@ -103,8 +109,16 @@ def setup(app: Sphinx) -> dict[str, bool]:
 
     # Register event callbacks
     app.connect("builder-inited", _update_config_for_builder)  # Update configuration values for builder used
-    app.connect("env-before-read-docs", create_pep_zero)  # PEP 0 hook
+    if "single_pep" in app.tags:
+        # After any other handlers, which may add documents to read
+        app.connect("env-before-read-docs", single_pep.prune_docs_to_read, priority=900)
+        app.connect("doctree-read", single_pep.record_linked_peps)
+        app.connect("env-updated", single_pep.read_linked_peps)
+    else:
+        app.connect("env-before-read-docs", create_pep_zero)  # PEP 0 hook
     app.connect('html-page-context', set_description)
+    FEED_METADATA.connect(app)  # For create_rss_feed
+    pep_references.SECTION_TITLES.connect(app)  # For PEPReferenceRoleTitleText
 
     # Mathematics rendering
     inline_maths = HTMLTranslator.visit_math, None
@@ -0,0 +1,54 @@
+"""Data recorded in the build environment for each PEP as it is read."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils import nodes
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+PEP_DOCNAME = re.compile(r"pep-\d{4}")
+
+
+class PEPEnvData:
+    """Data for each PEP, kept in a dictionary attribute of the build environment.
+
+    ``extract`` is called with the doctree of each PEP as it is read, and
+    its result is stored by docname. The data is removed when a document
+    is purged, and collected from parallel reader processes.
+    """
+
+    def __init__(self, attribute: str, extract: Callable[[nodes.document], object]) -> None:
+        self.attribute = attribute
+        self.extract = extract
+
+    def connect(self, app: Sphinx) -> None:
+        app.connect("doctree-read", self.record)
+        app.connect("env-purge-doc", self.purge)
+        app.connect("env-merge-info", self.merge)
+
+    def data(self, env: BuildEnvironment) -> dict[str, object]:
+        """Return the data of every PEP recorded in ``env``."""
+        if not hasattr(env, self.attribute):
+            setattr(env, self.attribute, {})
+        return getattr(env, self.attribute)
+
+    def record(self, app: Sphinx, doctree: nodes.document) -> None:
+        data = self.data(app.env)
+        if PEP_DOCNAME.fullmatch(app.env.docname):
+            data[app.env.docname] = self.extract(doctree)
+
+    def purge(self, app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+        if hasattr(env, self.attribute):
+            getattr(env, self.attribute).pop(docname, None)
+
+    def merge(self, app: Sphinx, env: BuildEnvironment, docnames: set[str], other: BuildEnvironment) -> None:
+        """Collect the data recorded by a parallel reader process."""
+        data = self.data(env)
+        other_data = getattr(other, self.attribute, {})
+        data |= {docname: other_data[docname] for docname in docnames if docname in other_data}
@@ -4,13 +4,24 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import heapq
 import pickle
 from email.utils import format_datetime, getaddresses
 from html import escape
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from docutils import nodes
 
+from pep_sphinx_extensions.env_data import PEPEnvData
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from sphinx.environment import BuildEnvironment
+
 RSS_DESCRIPTION = (
     "Newest Python Enhancement Proposals (PEPs): "
     "Information on new language features "
@@ -23,32 +34,51 @@ def _format_rfc_2822(datetime: dt.datetime) -> str:
     return format_datetime(datetime, usegmt=True)
 
 
-document_cache: dict[Path, dict[str, str]] = {}
-
+# Headers recorded for each PEP at read time, along with the abstract
+FEED_HEADERS = ("PEP", "Title", "Author", "Created")
 
-def get_from_doctree(full_path: Path, text: str) -> str:
-    # Try and retrieve from cache
-    if full_path in document_cache:
-        return document_cache[full_path].get(text, "")
 
-    # Else load doctree
+@functools.lru_cache(maxsize=64)
+def _doctree_metadata(full_path: Path) -> dict[str, str]:
+    # Only the most recently used doctrees are kept, to bound memory use
     document = pickle.loads(full_path.read_bytes())
-    # Store the headers (populated in the PEPHeaders transform)
-    document_cache[full_path] = path_cache = document.get("headers", {})
-    # Store the Abstract
-    path_cache["Abstract"] = pep_abstract(document)
-    # Return the requested key
-    return path_cache.get(text, "")
+    return pep_metadata(document)
+
+
+def lookup_pep_metadata(env: BuildEnvironment, docname: str, doctree: nodes.document | None = None) -> dict[str, str]:
+    """Return the feed metadata of a PEP, preferring data recorded at read time.
+
+    Otherwise, use ``doctree`` if given, and only then load the pickled doctree.
+    """
+    try:
+        return FEED_METADATA.data(env)[docname]
+    except KeyError:
+        pass
+    if doctree is not None:
+        return pep_metadata(doctree)
+    return _doctree_metadata(Path(env.doctreedir, f"{docname}.doctree"))
 
 
-def pep_creation(full_path: Path) -> dt.datetime:
-    created_str = get_from_doctree(full_path, "Created")
+def pep_creation(created_str: str) -> dt.datetime:
     try:
         return dt.datetime.strptime(created_str, "%d-%b-%Y")
     except ValueError:
         return dt.datetime.min
 
 
+def pep_metadata(document: nodes.document) -> dict[str, str]:
+    """Return the headers and abstract of a PEP needed for the feed."""
+    # Headers are populated in the PEPHeaders transform
+    headers = document.get("headers", {})
+    metadata = {key: headers[key] for key in FEED_HEADERS if key in headers}
+    metadata["Abstract"] = pep_abstract(document)
+    return metadata
+
+
+# Feed metadata of each PEP, recorded as it is read for create_rss_feed
+FEED_METADATA = PEPEnvData("pep_metadata", pep_metadata)
+
+
 def pep_abstract(document: nodes.document) -> str:
     """Return the first paragraph of the PEP abstract.
     If not found, return the first paragraph of the introduction.
@@ -69,21 +99,32 @@ def pep_abstract(document: nodes.document) -> str:
     return introduction
 
 
-def _generate_items(doctree_dir: Path):
-    # get list of peps with creation time (from "Created:" string in pep source)
-    peps_with_dt = sorted((pep_creation(path), path) for path in doctree_dir.glob("pep-????.doctree"))
+def _feed_entries(doctree_dir: Path, metadata: Mapping[str, Mapping[str, str]]):
+    for full_path in doctree_dir.glob("pep-????.doctree"):
+        try:
+            pep_info = metadata[full_path.stem]
+        except KeyError:
+            # Not recorded at read time (e.g. an environment from an older
+            # version of this extension), so fall back to the doctree
+            pep_info = _doctree_metadata(full_path)
+        yield pep_creation(pep_info.get("Created", "")), full_path.stem, pep_info
+
+
+def _generate_items(doctree_dir: Path, metadata: Mapping[str, Mapping[str, str]]):
+    # get the 10 most recent peps (from "Created:" string in pep source)
+    newest = heapq.nlargest(10, _feed_entries(doctree_dir, metadata), key=itemgetter(0, 1))
 
-    # generate rss items for 10 most recent peps (in reverse order)
-    for datetime, full_path in reversed(peps_with_dt[-10:]):
+    # generate rss items for the peps, newest first
+    for datetime, _docname, pep_info in newest:
         try:
-            pep_num = int(get_from_doctree(full_path, "PEP"))
+            pep_num = int(pep_info.get("PEP", ""))
         except ValueError:
             continue
 
-        title = get_from_doctree(full_path, "Title")
+        title = pep_info.get("Title", "")
         url = f"https://peps.python.org/pep-{pep_num:0>4}/"
-        abstract = get_from_doctree(full_path, "Abstract")
-        author = get_from_doctree(full_path, "Author")
+        abstract = pep_info.get("Abstract", "")
+        author = pep_info.get("Author", "")
         if "@" in author or " at " in author:
             parsed_authors = getaddresses([author])
             joined_authors = ", ".join(f"{name} ({email_address})" for name, email_address in parsed_authors)
@@ -102,10 +143,10 @@ def _generate_items(doctree_dir: Path):
         yield item
 
 
-def create_rss_feed(doctree_dir: Path, output_dir: Path):
+def create_rss_feed(doctree_dir: Path, output_dir: Path, metadata: Mapping[str, Mapping[str, str]] | None = None):
     # The rss envelope
     last_build_date = _format_rfc_2822(dt.datetime.now(dt.timezone.utc))
-    items = "\n".join(_generate_items(Path(doctree_dir)))
+    items = "\n".join(_generate_items(Path(doctree_dir), metadata or {}))
     output = f"""\
 <?xml version='1.0' encoding='UTF-8'?>
 <rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">
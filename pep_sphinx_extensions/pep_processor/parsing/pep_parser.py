@@ -10,6 +10,7 @@ from pep_sphinx_extensions.pep_processor.transforms import pep_headers
 from pep_sphinx_extensions.pep_processor.transforms import pep_title
 
 if TYPE_CHECKING:
+    from docutils import nodes
     from docutils import transforms
 
 
@@ -22,6 +23,11 @@ class PEPParser(parsers.RSTParser):
         """Mark the document as containing RFC 2822 headers."""
         super().__init__(rfc2822=True)
 
+    def parse(self, inputstring: str, document: nodes.document) -> None:
+        """Start an empty index of :pep: role references, filled by PEPRole."""
+        document["pep_references"] = []
+        super().parse(inputstring, document)
+
     def get_transforms(self) -> list[type[transforms.Transform]]:
         """Use our custom PEP transform rules."""
         return [
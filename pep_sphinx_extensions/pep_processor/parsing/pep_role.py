@@ -28,12 +28,13 @@ class PEPRole(roles.ReferenceRole):
         else:
             title = f"PEP {pep_num}"
 
-        return [
-            nodes.reference(
-                "", title,
-                internal=True,
-                refuri=ref_uri,
-                classes=["pep"],
-                _title_tuple=(pep_num, fragment)
-            )
-        ], []
+        reference = nodes.reference(
+            "", title,
+            internal=True,
+            refuri=ref_uri,
+            classes=["pep"],
+            _title_tuple=(pep_num, fragment)
+        )
+        # Index the references, so that transforms needn't search the whole document
+        self.inliner.document.setdefault("pep_references", []).append(reference)
+        return [reference], []
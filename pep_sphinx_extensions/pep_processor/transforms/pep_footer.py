@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
 import time
 from pathlib import Path
 import subprocess
@@ -62,7 +67,7 @@ def _add_source_link(pep_source_path: Path) -> nodes.paragraph:
 def _add_commit_history_info(pep_source_path: Path) -> nodes.paragraph:
     """Use local git history to find last modified date."""
     try:
-        iso_time = _LAST_MODIFIED_TIMES[pep_source_path.stem]
+        iso_time = last_modified_times()[pep_source_path.stem]
     except KeyError:
         return nodes.paragraph()
 
@@ -71,38 +76,130 @@ def _add_commit_history_info(pep_source_path: Path) -> nodes.paragraph:
     return nodes.paragraph("", "Last modified: ", link_node)
 
 
-def _get_last_modified_timestamps():
-    # get timestamps and changed files from all commits (without paging results)
-    args = ("git", "--no-pager", "log", "--format=#%at", "--name-only")
-    ret = subprocess.run(args, stdout=subprocess.PIPE, text=True, encoding="utf-8")
-    if ret.returncode:  # non-zero return code
-        return {}
-    all_modified = ret.stdout
+def _get_last_modified_timestamps(cache_file: Path | None = None) -> dict[str, str]:
+    """Map PEP file stems to the time of the last commit that modified them.
 
-    # remove "peps/" prefix from file names
-    all_modified = all_modified.replace("\npeps/", "\n")
+    If ``cache_file`` is given, the timestamps are stored there along with
+    the commit they were computed at. Later calls only walk the commits made
+    since then, or skip walking the history entirely if HEAD is unchanged.
+    """
+    head = _git("rev-parse", "HEAD")
+    if head is None:
+        return {}
+    head = head.strip()
+
+    cached = _read_cache(cache_file)
+    if cached is not None and cached["head"] == head:
+        all_modified = cached["last_modified"]
+    elif cached is not None and _git("merge-base", "--is-ancestor", cached["head"], head) is not None:
+        # only walk the new commits. A merge can also bring in commits made
+        # before the cached HEAD, which a full walk lists after it, so these
+        # only apply to PEPs that aren't in the cache.
+        new_modified = _git_log_timestamps(f"{cached['head']}..{head}")
+        cached_head_time = _git("log", "-1", "--format=%ct", cached["head"])
+        if new_modified is None or cached_head_time is None:
+            return {}
+        all_modified = cached["last_modified"].copy()
+        for file, (timestamp, commit_time) in new_modified.items():
+            if commit_time > int(cached_head_time) or file not in all_modified:
+                all_modified[file] = timestamp
+    else:
+        all_modified = _git_log_timestamps(head)
+        if all_modified is None:
+            return {}
+        all_modified = {file: timestamp for file, (timestamp, _commit_time) in all_modified.items()}
+
+    if cache_file is not None and (cached is None or cached["head"] != head):
+        _write_cache(cache_file, {"head": head, "last_modified": all_modified})
 
     # set up the dictionary with the *current* files
     peps_dir = Path(__file__, "..", "..", "..", "..", "peps").resolve()
-    last_modified = {path.stem: "" for path in peps_dir.glob("pep-????.rst")}
+    return {path.stem: all_modified.get(path.stem, "") for path in peps_dir.glob("pep-????.rst")}
+
+
+def _git_log_timestamps(revisions: str) -> dict[str, tuple[str, int]] | None:
+    """Map PEP file stems to the author and commit times of the last commit to modify them.
+
+    The last commit is the first listed by ``git log``, which is ordered by commit date.
+    """
+    # get timestamps and changed files from all commits (without paging results)
+    all_modified = _git("log", "--format=#%at %ct", "--name-only", revisions)
+    if all_modified is None:  # non-zero return code
+        return None
+    if not all_modified:
+        return {}  # no commits
+
+    # remove "peps/" prefix from file names
+    all_modified = all_modified.replace("\npeps/", "\n")
 
     # iterate through newest to oldest, updating per file timestamps
+    last_modified = {}
     change_sets = all_modified.removeprefix("#").split("#")
     for change_set in change_sets:
-        timestamp, files = change_set.split("\n", 1)
+        timestamps, files = change_set.split("\n", 1)
+        try:
+            author_time, commit_time = map(int, timestamps.split())
+            y, m, d, hh, mm, ss, *_ = time.gmtime(author_time)
+        except ValueError:
+            continue  # if int conversion fails
         for file in files.strip().split("\n"):
             if not file.startswith("pep-") or not file.endswith((".rst", ".txt")):
                 continue  # not a PEP
             file = file[:-4]
-            if last_modified.get(file) != "":
+            if file in last_modified:
                 continue  # most recent modified date already found
-            try:
-                y, m, d, hh, mm, ss, *_ = time.gmtime(float(timestamp))
-            except ValueError:
-                continue  # if float conversion fails
-            last_modified[file] = f"{y:04}-{m:02}-{d:02} {hh:02}:{mm:02}:{ss:02}"
+            last_modified[file] = f"{y:04}-{m:02}-{d:02} {hh:02}:{mm:02}:{ss:02}", commit_time
 
     return last_modified
 
 
-_LAST_MODIFIED_TIMES = _get_last_modified_timestamps()
+def _git(*args: str) -> str | None:
+    """Run a git command, returning its output or None on failure."""
+    ret = subprocess.run(
+        ("git", "--no-pager", *args),
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+    )
+    if ret.returncode:  # non-zero return code
+        return None
+    return ret.stdout
+
+
+def _git_cache_file(name: str) -> Path | None:
+    """Return a path for ``name`` inside the git directory."""
+    git_path = _git("rev-parse", "--git-path", name)
+    if git_path is None:
+        return None
+    return Path(git_path.strip()).resolve()
+
+
+def _read_cache(cache_file: Path | None) -> dict | None:
+    if cache_file is None:
+        return None
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None  # missing or corrupt cache
+    if not isinstance(cached, dict) or not {"head", "last_modified"} <= cached.keys():
+        return None
+    return cached
+
+
+def _write_cache(cache_file: Path, data: dict) -> None:
+    # write to a temporary file first, as other processes may read the cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # the cache is only an optimisation
+
+
+@functools.cache
+def last_modified_times() -> dict[str, str]:
+    """Return the last modified times of all PEPs, computed on first use.
+
+    The Sphinx extension calls this before reading, so that parallel
+    reader processes inherit the result instead of each running git.
+    Call ``last_modified_times.cache_clear()`` to recompute.
+    """
+    return _get_last_modified_timestamps(_git_cache_file("peps-last-modified.json"))
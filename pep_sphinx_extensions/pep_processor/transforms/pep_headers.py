@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from pathlib import Path
 import re
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 from docutils import nodes
 from docutils import transforms
 from sphinx import errors
 
+from pep_metadata.thread_urls import classify_thread_url
 from pep_sphinx_extensions.pep_processor.transforms import pep_zero
 from pep_sphinx_extensions.pep_processor.transforms.pep_zero import _mask_email
 from pep_sphinx_extensions.pep_zero_generator.constants import (
@@ -23,6 +28,13 @@ from pep_sphinx_extensions.pep_zero_generator.constants import (
     TYPE_STANDARDS,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import TypeAlias
+
+    # Called with the document, the lower-case field name, and the field's paragraph
+    HeaderHandler: TypeAlias = Callable[[nodes.document, str, nodes.paragraph], "bool | None"]
+
 ABBREVIATED_STATUSES = {
     STATUS_DRAFT: "Proposal under active discussion and revision",
     STATUS_DEFERRED: "Inactive draft that may be taken up again at a later time",
@@ -91,11 +103,9 @@ class PEPHeaders(transforms.Transform):
         fields_to_remove = []
         self.document["headers"] = headers = {}
         for field in header:
-            row_attributes = {sub.tagname: sub.rawsource for sub in field}
-            headers[row_attributes["field_name"]] = row_attributes["field_body"]
+            field_name, body = field
+            headers[field_name.rawsource] = body.rawsource
 
-            name = field[0].astext().lower()
-            body = field[1]
             if len(body) == 0:
                 # body is empty
                 continue
@@ -107,74 +117,9 @@ class PEPHeaders(transforms.Transform):
                 raise PEPParsingError(msg)
 
             para = body[0]
-            if name in {"author", "bdfl-delegate", "pep-delegate", "sponsor"}:
-                # mask emails
-                for node in para:
-                    if not isinstance(node, nodes.reference):
-                        continue
-                    node.replace_self(_mask_email(node))
-            elif name in {"discussions-to", "resolution", "post-history"}:
-                # Prettify mailing list and Discourse links
-                for node in para:
-                    if (not isinstance(node, nodes.reference)
-                            or not node["refuri"]):
-                        continue
-                    # If the Resolution header is already a link, don't prettify it
-                    if name == "resolution" and node["refuri"] != node[0]:
-                        continue
-                    # Have known mailto links link to their main list pages
-                    if node["refuri"].lower().startswith("mailto:"):
-                        node["refuri"] = _generate_list_url(node["refuri"])
-                    parts = node["refuri"].lower().split("/")
-                    if len(parts) <= 2 or parts[2] not in LINK_PRETTIFIERS:
-                        continue
-                    pretty_title = _make_link_pretty(str(node["refuri"]))
-                    if name == "post-history":
-                        node["reftitle"] = pretty_title
-                    else:
-                        node[0] = nodes.Text(pretty_title)
-            elif name in {"replaces", "superseded-by", "requires"}:
-                # replace PEP numbers with normalised list of links to PEPs
-                new_body = []
-                for pep_str in re.split(r",?\s+", body.astext()):
-                    target = self.document.settings.pep_url.format(int(pep_str))
-                    if self.document.settings.builder == "dirhtml":
-                        target = f"../{target}"
-                    new_body += [nodes.reference("", pep_str, refuri=target), nodes.Text(", ")]
-                para[:] = new_body[:-1]  # drop trailing space
-            elif name == "topic":
-                new_body = []
-                for topic_name in body.astext().split(","):
-                    if topic_name:
-                        target = f"topic/{topic_name.lower().strip()}"
-                        if self.document.settings.builder == "html":
-                            target = f"{target}.html"
-                        else:
-                            target = f"../{target}/"
-                        new_body += [
-                            nodes.reference("", topic_name, refuri=target),
-                            nodes.Text(", "),
-                        ]
-                if new_body:
-                    para[:] = new_body[:-1]  # Drop trailing space/comma
-            elif name == "status":
-                para[:] = [
-                    nodes.abbreviation(
-                        body.astext(),
-                        body.astext(),
-                        explanation=_abbreviate_status(body.astext()),
-                    )
-                ]
-            elif name == "type":
-                para[:] = [
-                    nodes.abbreviation(
-                        body.astext(),
-                        body.astext(),
-                        explanation=_abbreviate_type(body.astext()),
-                    )
-                ]
-            elif name in {"last-modified", "content-type", "version"}:
-                # Mark unneeded fields
+            name = field_name.astext().lower()
+            handler = HEADER_HANDLERS.get(name)
+            if handler is not None and handler(self.document, name, para):
                 fields_to_remove.append(field)
 
             # Remove any trailing commas and whitespace in the headers
@@ -190,6 +135,116 @@ class PEPHeaders(transforms.Transform):
             field.parent.remove(field)
 
 
+# Handlers for the bodies of header fields, by lower-case field name
+HEADER_HANDLERS: dict[str, HeaderHandler] = {}
+
+# Hosts of Discussions-To, Post-History and Resolution links that must be prettified
+PRETTIFIED_HOSTS = frozenset({"mail.python.org", "discuss.python.org"})
+
+# Separates the PEP numbers in the Replaces, Superseded-By and Requires headers
+PEP_LIST_SEPARATOR = re.compile(r",?\s+")
+
+
+def register_header_handler(*names: str) -> Callable[[HeaderHandler], HeaderHandler]:
+    """Register a function to process the named header fields, replacing any existing handler.
+
+    The handler is called with the document, the lower-case field name and
+    the paragraph in the field's body, which it may change in place. If it
+    returns True, the field is removed from the header.
+    """
+    def decorator(handler: HeaderHandler) -> HeaderHandler:
+        for name in names:
+            HEADER_HANDLERS[name.lower()] = handler
+        return handler
+    return decorator
+
+
+@register_header_handler("Author", "BDFL-Delegate", "PEP-Delegate", "Sponsor")
+def _mask_emails(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    for node in para:
+        if isinstance(node, nodes.reference):
+            node.replace_self(_mask_email(node))
+
+
+@register_header_handler("Discussions-To", "Resolution", "Post-History")
+def _prettify_links(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    """Prettify mailing list and Discourse links.
+
+    Links to mail.python.org or discuss.python.org that aren't to a list,
+    message, thread or category are an error.
+    """
+    for node in para:
+        if not isinstance(node, nodes.reference) or not node["refuri"]:
+            continue
+        # If the Resolution header is already a link, don't prettify it
+        if name == "resolution" and node["refuri"] != node[0]:
+            continue
+        # Have known mailto links link to their main list pages
+        if node["refuri"].lower().startswith("mailto:"):
+            node["refuri"] = _generate_list_url(node["refuri"])
+        # A query string or fragment doesn't change the thread being linked to
+        url = urlsplit(node["refuri"].lower().strip())
+        thread_url = classify_thread_url(url._replace(query="", fragment="").geturl())
+        if thread_url is None:
+            if url.hostname in PRETTIFIED_HOSTS:
+                msg = f"{node['refuri']} not a link to a list, message, thread or category"
+                raise PEPParsingError(msg)
+            continue
+        pretty_title = thread_url.pretty_title
+        if name == "post-history":
+            node["reftitle"] = pretty_title
+        else:
+            node[0] = nodes.Text(pretty_title)
+
+
+@register_header_handler("Replaces", "Superseded-By", "Requires")
+def _link_peps(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    """Replace PEP numbers with a normalised list of links to the PEPs."""
+    new_body = []
+    for pep_str in PEP_LIST_SEPARATOR.split(para.astext()):
+        target = document.settings.pep_url.format(int(pep_str))
+        if document.settings.builder == "dirhtml":
+            target = f"../{target}"
+        new_body += [nodes.reference("", pep_str, refuri=target), nodes.Text(", ")]
+    para[:] = new_body[:-1]  # drop trailing space
+
+
+@register_header_handler("Topic")
+def _link_topics(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    new_body = []
+    for topic_name in para.astext().split(","):
+        if topic_name:
+            target = f"topic/{topic_name.lower().strip()}"
+            if document.settings.builder == "html":
+                target = f"{target}.html"
+            else:
+                target = f"../{target}/"
+            new_body += [
+                nodes.reference("", topic_name, refuri=target),
+                nodes.Text(", "),
+            ]
+    if new_body:
+        para[:] = new_body[:-1]  # Drop trailing space/comma
+
+
+@register_header_handler("Status")
+def _abbreviate_status_header(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    status = para.astext()
+    para[:] = [nodes.abbreviation(status, status, explanation=_abbreviate_status(status))]
+
+
+@register_header_handler("Type")
+def _abbreviate_type_header(document: nodes.document, name: str, para: nodes.paragraph) -> None:
+    type_ = para.astext()
+    para[:] = [nodes.abbreviation(type_, type_, explanation=_abbreviate_type(type_))]
+
+
+@register_header_handler("Last-Modified", "Content-Type", "Version")
+def _remove_field(document: nodes.document, name: str, para: nodes.paragraph) -> bool:
+    """Mark unneeded fields."""
+    return True
+
+
 def _generate_list_url(mailto: str) -> str:
     list_name_domain = mailto.lower().removeprefix("mailto:").strip()
     list_name = list_name_domain.split("@")[0]
@@ -210,85 +265,6 @@ def _generate_list_url(mailto: str) -> str:
     return f"https://mail.python.org/archives/list/{list_name}@python.org/"
 
 
-def _process_list_url(parts: list[str]) -> tuple[str, str]:
-    item_type = "list"
-
-    # HyperKitty (Mailman3) archive structure is
-    # https://mail.python.org/archives/list/<list_name>/thread/<id>
-    if "archives" in parts:
-        list_name = (
-            parts[parts.index("archives") + 2].removesuffix("@python.org"))
-        if len(parts) > 6 and parts[6] in {"message", "thread"}:
-            item_type = parts[6]
-
-    # Mailman3 list info structure is
-    # https://mail.python.org/mailman3/lists/<list_name>.python.org/
-    elif "mailman3" in parts:
-        list_name = (
-            parts[parts.index("mailman3") + 2].removesuffix(".python.org"))
-
-    # Pipermail (Mailman) archive structure is
-    # https://mail.python.org/pipermail/<list_name>/<month>-<year>/<id>
-    elif "pipermail" in parts:
-        list_name = parts[parts.index("pipermail") + 1]
-        item_type = "message" if len(parts) > 6 else "list"
-
-    # Mailman listinfo structure is
-    # https://mail.python.org/mailman/listinfo/<list_name>
-    elif "listinfo" in parts:
-        list_name = parts[parts.index("listinfo") + 1]
-
-    # Not a link to a mailing list, message or thread
-    else:
-        raise ValueError(
-            f"{'/'.join(parts)} not a link to a list, message or thread")
-
-    return list_name, item_type
-
-
-def _process_discourse_url(parts: list[str]) -> tuple[str, str]:
-    item_name = "discourse"
-
-    if len(parts) < 5 or ("t" not in parts and "c" not in parts):
-        raise ValueError(
-            f"{'/'.join(parts)} not a link to a Discourse thread or category")
-
-    first_subpart = parts[4]
-    has_title = not first_subpart.isnumeric()
-
-    if "t" in parts:
-        item_type = "message" if len(parts) > (5 + has_title) else "thread"
-    elif "c" in parts:
-        item_type = "category"
-        if has_title:
-            item_name = f"{first_subpart.replace('-', ' ')} {item_name}"
-
-    return item_name, item_type
-
-
-# Domains supported for pretty URL parsing
-LINK_PRETTIFIERS = {
-    "mail.python.org": _process_list_url,
-    "discuss.python.org": _process_discourse_url,
-}
-
-
-def _process_pretty_url(url: str) -> tuple[str, str]:
-    parts = url.lower().strip().strip("/").split("/")
-    try:
-        item_name, item_type = LINK_PRETTIFIERS[parts[2]](parts)
-    except KeyError as error:
-        raise ValueError(
-            f"{url} not a link to a recognized domain to prettify") from error
-    item_name = item_name.title().replace("Sig", "SIG").replace("Pep", "PEP")
-    return item_name, item_type
-
-
-def _make_link_pretty(url: str) -> str:
-    item_name, item_type = _process_pretty_url(url)
-    return f"{item_name} {item_type}"
-
-
 def _abbreviate_status(status: str) -> str:
     if status in SPECIAL_STATUSES:
         status = SPECIAL_STATUSES[status]
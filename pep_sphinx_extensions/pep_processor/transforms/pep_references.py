@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from pathlib import Path
 
 from docutils import nodes
 from docutils import transforms
 
+from pep_sphinx_extensions.env_data import PEPEnvData
+
 
 class PEPReferenceRoleTitleText(transforms.Transform):
     """Add title text of document titles to reference role references."""
@@ -12,25 +16,56 @@ class PEPReferenceRoleTitleText(transforms.Transform):
     def apply(self) -> None:
         if not Path(self.document["source"]).match("pep-*"):
             return  # not a PEP file, exit early
-        for node in self.document.findall(nodes.reference):
-            if "_title_tuple" not in node:
-                continue
-
+        for node in pep_role_references(self.document):
             # get pep number and section target (fragment)
             pep_num, fragment = node.attributes.pop("_title_tuple")
             filename = f"pep-{pep_num:0>4}"
 
-            # Cache target_ids
+            # Section titles are recorded when each PEP is read
             env = self.document.settings.env
+            all_titles = SECTION_TITLES.data(env)
             try:
-                target_ids = env.document_ids[filename]
+                target_titles = all_titles[filename]
             except KeyError:
-                env.document_ids[filename] = target_ids = env.get_doctree(filename).ids
+                # Not recorded (e.g. an environment from an older version
+                # of this extension), so fall back to the doctree
+                target_titles = all_titles[filename] = section_titles(env.get_doctree(filename))
 
             # Create title text string. We hijack the 'reftitle' attribute so
             # that we don't have to change things in the HTML translator
             node["reftitle"] = env.titles[filename].astext()
             try:
-                node["reftitle"] += f" § {target_ids[fragment][0].astext()}"
+                node["reftitle"] += f" § {target_titles[fragment]}"
             except KeyError:
                 pass
+
+
+def pep_role_references(document: nodes.document) -> list[nodes.reference]:
+    """Return the references created by the :pep: role in the document.
+
+    PEPRole indexes its references as the document is parsed. The whole
+    document is only searched if the index may be incomplete: references
+    in substitutions are copied, and the index of a copied document (or
+    one parsed by an older version of this extension) refers to other nodes.
+    """
+    references = document.get("pep_references")
+    if (
+        references is None
+        or document.substitution_defs
+        or any(node.document is not document for node in references)
+    ):
+        return [node for node in document.findall(nodes.reference) if "_title_tuple" in node]
+    return [node for node in references if "_title_tuple" in node]
+
+
+def section_titles(document: nodes.document) -> dict[str, str]:
+    """Map the ids of sections (and other titled targets) to their titles."""
+    titles = {}
+    for target_id, node in document.ids.items():
+        if len(node) and isinstance(node[0], (nodes.title, nodes.label, nodes.Text)):
+            titles[target_id] = node[0].astext()
+    return titles
+
+
+# Section titles of each PEP, recorded as it is read for PEPReferenceRoleTitleText
+SECTION_TITLES = PEPEnvData("pep_section_titles", section_titles)
@@ -1,4 +1,5 @@
 from pathlib import Path
+import re
 
 from docutils import nodes
 from docutils import transforms
@@ -57,8 +58,16 @@ class PEPTitle(transforms.Transform):
             field.parent.remove(field)
 
 
+# Characters and strings which may start inline markup, an escape, a standalone
+# hyperlink, or a literal block ("::") when parsed as RST
+_MARKUP_CHARS = re.compile(r"[*`_|\\\[\]<>@\n]|://|::$")
+
+
 def _line_to_nodes(text: str) -> list[nodes.Node]:
     """Parse RST string to nodes."""
+    if _MARKUP_CHARS.search(text) is None and text == text.strip():
+        # Plain text, as most titles are, doesn't need the parser
+        return [nodes.Text(text)]
     document = utils.new_document("<inline-rst>")
     document.settings.pep_references = document.settings.rfc_references = False  # patch settings
     states.RSTStateMachine(state_classes=states.state_classes, initial_state="Body").run([text], document)  # do parsing
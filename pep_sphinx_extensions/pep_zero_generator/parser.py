@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 from collections.abc import Iterable, Sequence
-from email.parser import HeaderParser
 from pathlib import Path
 
+from pep_metadata.headers import read_header_lines
+from pep_metadata.headers import tokenize_headers
 from pep_sphinx_extensions.pep_zero_generator.constants import ACTIVE_ALLOWED
 from pep_sphinx_extensions.pep_zero_generator.constants import HIDE_STATUS
 from pep_sphinx_extensions.pep_zero_generator.constants import SPECIAL_STATUSES
@@ -18,7 +20,7 @@ from pep_sphinx_extensions.pep_zero_generator.constants import TYPE_VALUES
 from pep_sphinx_extensions.pep_zero_generator.errors import PEPError
 
 
-@dataclasses.dataclass(order=True, frozen=True)
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
 class _Author:
     """Represent PEP authors."""
     full_name: str  # The author's name.
@@ -35,11 +37,37 @@ class PEP:
         status : The PEP's status.  Value must be found in STATUS_VALUES.
         authors : A list of the authors.
 
+    PEPs are immutable once parsed, as the values derived from the headers
+    (``joined_authors``, ``shorthand`` and ``url``) are computed up front.
+
     """
 
     # The required RFC 822 headers for all PEPs.
     required_headers = {"PEP", "Title", "Author", "Status", "Type", "Created"}
 
+    __slots__ = (
+        "filename",
+        "header_digest",
+        "number",
+        "title",
+        "pep_type",
+        "status",
+        "authors",
+        "topic",
+        "created",
+        "discussions_to",
+        "python_version",
+        "replaces",
+        "requires",
+        "resolution",
+        "superseded_by",
+        "post_history",
+        # Derived values, computed from the headers
+        "joined_authors",
+        "shorthand",
+        "url",
+    )
+
     def __init__(self, filename: Path):
         """Init object from an open PEP file object.
 
@@ -48,10 +76,14 @@ class PEP:
         """
         self.filename: Path = filename
 
-        # Parse the headers.
-        pep_text = filename.read_text(encoding="utf-8")
-        metadata = HeaderParser().parsestr(pep_text)
-        required_header_misses = PEP.required_headers - set(metadata.keys())
+        # Parse the headers. Only the first of any duplicate header is used.
+        header_lines = read_header_lines(filename)
+        metadata: dict[str, str] = {}
+        for header in tokenize_headers(header_lines):
+            metadata.setdefault(header.name, header.value)
+        # Digest of the raw header block, used to detect index pages that need regenerating
+        self.header_digest: str = hashlib.sha256("\n".join(header_lines).encode("utf-8")).hexdigest()
+        required_header_misses = PEP.required_headers - metadata.keys()
         if required_header_misses:
             _raise_pep_error(self, f"PEP is missing required headers {required_header_misses}")
 
@@ -101,18 +133,41 @@ class PEP:
 
         # Other headers
         self.created = metadata["Created"]
-        self.discussions_to = metadata["Discussions-To"]
-        self.python_version = metadata["Python-Version"]
-        self.replaces = metadata["Replaces"]
-        self.requires = metadata["Requires"]
-        self.resolution = metadata["Resolution"]
-        self.superseded_by = metadata["Superseded-By"]
-        if metadata["Post-History"]:
+        self.discussions_to = metadata.get("Discussions-To")
+        self.python_version = metadata.get("Python-Version")
+        self.replaces = metadata.get("Replaces")
+        self.requires = metadata.get("Requires")
+        self.resolution = metadata.get("Resolution")
+        self.superseded_by = metadata.get("Superseded-By")
+        if metadata.get("Post-History"):
             # Squash duplicate whitespace
             self.post_history = " ".join(metadata["Post-History"].split())
         else:
             self.post_history = None
 
+        # The comma-separated list of authors
+        self.joined_authors: str = ", ".join(self._author_names)
+        # reStructuredText tooltip for the PEP type and status
+        type_code = self.pep_type[0].upper()
+        if self.status in HIDE_STATUS:
+            self.shorthand: str = f":abbr:`{type_code} ({self.pep_type}, {self.status})`"
+        else:
+            status_code = self.status[0].upper()
+            self.shorthand: str = f":abbr:`{type_code}{status_code} ({self.pep_type}, {self.status})`"
+        # The canonical URL of the rendered PEP, set last as it marks the PEP as complete
+        self.url: str = f"https://peps.python.org/pep-{self.number:0>4}/"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if hasattr(self, "url"):
+            raise AttributeError(f"cannot set {name!r}: PEP objects are immutable once parsed")
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state: tuple[None, dict[str, object]]) -> None:
+        # Unpickle (e.g. from worker processes) without the immutability check
+        _dict_state, slots_state = state
+        for name, value in slots_state.items():
+            object.__setattr__(self, name, value)
+
     def __repr__(self) -> str:
         return f"<PEP {self.number:0>4} - {self.title}>"
 
@@ -127,15 +182,6 @@ class PEP:
         """An iterator of the authors' full names."""
         return (author.full_name for author in self.authors)
 
-    @property
-    def shorthand(self) -> str:
-        """Return reStructuredText tooltip for the PEP type and status."""
-        type_code = self.pep_type[0].upper()
-        if self.status in HIDE_STATUS:
-            return f":abbr:`{type_code} ({self.pep_type}, {self.status})`"
-        status_code = self.status[0].upper()
-        return f":abbr:`{type_code}{status_code} ({self.pep_type}, {self.status})`"
-
     @property
     def details(self) -> dict[str, str | int]:
         """Return the line entry for the PEP."""
@@ -145,7 +191,7 @@ class PEP:
             # a tooltip representing the type and status
             "shorthand": self.shorthand,
             # the comma-separated list of authors
-            "authors": ", ".join(self._author_names),
+            "authors": self.joined_authors,
             # The targeted Python-Version (if present) or the empty string
             "python_version": self.python_version or "",
         }
@@ -156,7 +202,7 @@ class PEP:
         return {
             "number": self.number,
             "title": self.title,
-            "authors": ", ".join(self._author_names),
+            "authors": self.joined_authors,
             "discussions_to": self.discussions_to,
             "status": self.status,
             "type": self.pep_type,
@@ -170,7 +216,7 @@ class PEP:
             "superseded_by": self.superseded_by,
             # extra non-header keys for use in ``peps.json``
             "author_names": tuple(self._author_names),
-            "url": f"https://peps.python.org/pep-{self.number:0>4}/",
+            "url": self.url,
         }
 
 
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,7 @@ from pep_sphinx_extensions.pep_zero_generator import parser
 from pep_sphinx_extensions.pep_zero_generator import subindices
 from pep_sphinx_extensions.pep_zero_generator import writer
 from pep_sphinx_extensions.pep_zero_generator.constants import SUBINDICES_BY_TOPIC
+from pep_sphinx_extensions.pep_zero_generator.errors import PEPError
 from release_management.serialize import create_release_cycle, create_release_json
 
 if TYPE_CHECKING:
@@ -33,9 +35,9 @@ if TYPE_CHECKING:
     from sphinx.environment import BuildEnvironment
 
 
-def _parse_peps(path: Path) -> list[parser.PEP]:
+def _parse_peps(path: Path, jobs: int = 1) -> list[parser.PEP]:
     # Read from root directory
-    peps: list[parser.PEP] = []
+    pep_paths: list[Path] = []
 
     for file_path in path.iterdir():
         if not file_path.is_file():
@@ -43,10 +45,35 @@ def _parse_peps(path: Path) -> list[parser.PEP]:
         if file_path.match("pep-0000*"):
             continue  # Skip pre-existing PEP 0 files
         if file_path.match("pep-????.rst"):
-            pep = parser.PEP(path.joinpath(file_path).absolute())
-            peps.append(pep)
+            pep_paths.append(path.joinpath(file_path).absolute())
 
-    return sorted(peps)
+    # Parse in worker processes if parallel builds were requested
+    jobs = min(jobs, os.cpu_count() or 1)
+    if jobs > 1:
+        chunk_size = max(len(pep_paths) // (jobs * 4), 1)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_parse_pep, pep_paths, chunksize=chunk_size))
+    else:
+        results = list(map(_parse_pep, pep_paths))
+
+    # Report every invalid PEP at once, rather than just the first
+    errors = [result for result in results if isinstance(result, PEPError)]
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        err_output = "\n".join(" " * 4 + str(error) for error in errors)
+        raise PEPError(f"{len(errors)} PEPs could not be parsed:\n{err_output}", path)
+
+    return sorted(results)
+
+
+def _parse_pep(file_path: Path) -> parser.PEP | PEPError:
+    try:
+        return parser.PEP(file_path)
+    except PEPError as error:
+        return error
+    except ValueError as error:  # e.g. from parsing the Author header
+        return PEPError(str(error), file_path)
 
 
 def create_pep_json(peps: list[parser.PEP]) -> str:
@@ -61,16 +88,30 @@ def write_peps_json(peps: list[parser.PEP], path: Path) -> None:
 
 
 def create_pep_zero(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
-    peps = _parse_peps(Path(app.srcdir))
-
-    numerical_index_text = writer.PEPZeroWriter().write_numerical_index(peps)
-    subindices.update_sphinx("numerical", numerical_index_text, docnames, env)
-
-    pep0_text = writer.PEPZeroWriter().write_pep0(peps, builder=env.settings["builder"])
-    pep0_path = subindices.update_sphinx("pep-0000", pep0_text, docnames, env)
-    peps.append(parser.PEP(pep0_path))
-
-    subindices.generate_subindices(SUBINDICES_BY_TOPIC, peps, docnames, env)
+    # Header digests of the generated index pages, persisted with the environment
+    if not hasattr(env, "pep_zero_digests"):
+        env.pep_zero_digests = {}
+
+    peps = _parse_peps(Path(app.srcdir), jobs=app.parallel)
+    # Group PEPs by category and topic once, for all index pages
+    all_peps, by_topic = writer.bucket_peps(peps, SUBINDICES_BY_TOPIC)
+
+    # Only regenerate pages whose PEP headers have changed, so that Sphinx
+    # doesn't have to re-read the (large) index pages on every build.
+    digest = subindices.index_digest(peps)
+    if not subindices.is_up_to_date("numerical", digest, env):
+        numerical_index_text = writer.PEPZeroWriter().write_numerical_index(peps)
+        subindices.update_sphinx("numerical", numerical_index_text, docnames, env, digest=digest)
+
+    digest = subindices.index_digest(peps, env.settings["builder"])
+    if not subindices.is_up_to_date("pep-0000", digest, env):
+        pep0_text = writer.PEPZeroWriter().write_pep0(
+            peps, builder=env.settings["builder"], categories=all_peps.categories,
+        )
+        subindices.update_sphinx("pep-0000", pep0_text, docnames, env, digest=digest)
+    peps.append(parser.PEP(Path(env.srcdir, "pep-0000.rst")))
+
+    subindices.generate_subindices(SUBINDICES_BY_TOPIC, by_topic, docnames, env)
 
     write_peps_json(peps, Path(app.outdir))
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,42 +10,89 @@ from typing import TYPE_CHECKING
 from pep_sphinx_extensions.pep_zero_generator import writer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sphinx.environment import BuildEnvironment
 
     from pep_sphinx_extensions.pep_zero_generator.parser import PEP
 
-
-def update_sphinx(filename: str, text: str, docnames: list[str], env: BuildEnvironment) -> Path:
+# Changes to the generator code, or to the status and type descriptions
+# (defined in pep_headers), must also invalidate previously generated pages
+_GENERATOR_DIGEST = hashlib.sha256(
+    b"".join(path.read_bytes() for path in sorted(Path(__file__).parent.glob("*.py")))
+    + repr((writer.ABBREVIATED_STATUSES, writer.ABBREVIATED_TYPES)).encode("utf-8")
+).digest()
+
+
+def index_digest(peps: Iterable[PEP], *extra: str) -> str:
+    """Return a digest of the PEP headers (and settings) an index page is built from."""
+    digest = hashlib.sha256(_GENERATOR_DIGEST)
+    for item in extra:
+        digest.update(item.encode("utf-8"))
+    for pep in peps:
+        digest.update(pep.header_digest.encode("ascii"))
+    return digest.hexdigest()
+
+
+def is_up_to_date(filename: str, digest: str, env: BuildEnvironment) -> bool:
+    """Check if the index page was last generated from the same PEP headers."""
+    if env.pep_zero_digests.get(filename) != digest:
+        return False
+    # The page must also still exist, and be known to the environment
+    if filename not in env.all_docs:
+        return False
+    return Path(env.srcdir, f"{filename}.rst").is_file()
+
+
+def update_sphinx(
+    filename: str,
+    text: str,
+    docnames: list[str],
+    env: BuildEnvironment,
+    digest: str | None = None,
+) -> Path:
     file_path = Path(env.srcdir, f"{filename}.rst")
     file_path.write_text(text, encoding="utf-8")
 
     # Add to files for builder
-    docnames.append(filename)
+    if filename not in docnames:
+        docnames.append(filename)
     # Add to files for writer
     env.found_docs.add(filename)
 
+    # Record the digest of the headers the page was generated from
+    if digest is not None:
+        env.pep_zero_digests[filename] = digest
+
     return file_path
 
 
 def generate_subindices(
     subindices: dict[str, str],
-    peps: list[PEP],
+    buckets: dict[str, writer.PEPBucket],
     docnames: list[str],
     env: BuildEnvironment,
 ) -> None:
     # create topic directory
     os.makedirs(os.path.join(env.srcdir, "topic"), exist_ok=True)
 
+    _remove_stale_subindices(subindices, docnames, env)
+
     # Create sub index page
     generate_topic_contents(docnames, env)
 
     for subindex, additional_description in subindices.items():
+        bucket = buckets[subindex.lower()]
+
+        # Skip topics where no PEP headers have changed
+        digest = index_digest(bucket.peps, subindex, additional_description)
+        if is_up_to_date(f"topic/{subindex}", digest, env):
+            continue
+
         header_text = f"{subindex.title()} PEPs"
         header_line = "#" * len(header_text)
         header = header_text + "\n" + header_line + "\n"
 
-        topic = subindex.lower()
-        filtered_peps = [pep for pep in peps if topic in pep.topic]
         subindex_intro = f"""\
 This is the index of all Python Enhancement Proposals (PEPs) labelled
 under the '{subindex.title()}' topic. This is a sub-index of :pep:`0`,
@@ -53,12 +101,31 @@ the PEP index.
 {additional_description}
 """
         subindex_text = writer.PEPZeroWriter().write_pep0(
-            filtered_peps, header, subindex_intro, is_pep0=False,
+            bucket.peps, header, subindex_intro, is_pep0=False, categories=bucket.categories,
         )
-        update_sphinx(f"topic/{subindex}", subindex_text, docnames, env)
+        update_sphinx(f"topic/{subindex}", subindex_text, docnames, env, digest=digest)
+
+
+def _remove_stale_subindices(subindices: dict[str, str], docnames: list[str], env: BuildEnvironment) -> None:
+    """Delete generated pages for topics that no longer exist."""
+    current = {"index", *subindices}
+    for file_path in Path(env.srcdir, "topic").glob("*.rst"):
+        if file_path.stem in current:
+            continue
+        file_path.unlink()
+        filename = f"topic/{file_path.stem}"
+        env.found_docs.discard(filename)
+        env.pep_zero_digests.pop(filename, None)
+        if filename in docnames:
+            docnames.remove(filename)
+        # The topic index lists every page in the directory, so regenerate it
+        env.pep_zero_digests.pop("topic/index", None)
 
 
 def generate_topic_contents(docnames: list[str], env: BuildEnvironment):
+    digest = index_digest(())
+    if is_up_to_date("topic/index", digest, env):
+        return
     update_sphinx("topic/index", """\
 .. _topic-index:
 
@@ -73,4 +140,4 @@ PEPs are indexed by topic on the pages below:
    :glob:
 
    *
-""", docnames, env)
+""", docnames, env, digest=digest)
@@ -24,6 +24,8 @@ from pep_sphinx_extensions.pep_zero_generator.constants import TYPE_VALUES
 from pep_sphinx_extensions.pep_zero_generator.errors import PEPError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from pep_sphinx_extensions.pep_zero_generator.parser import PEP
 
 HEADER = """\
@@ -45,6 +47,47 @@ the PEP texts represent their historical record.
 """
 
 
+# Sections of the "Index by Category" part of PEP 0 and the sub-indices,
+# in the order returned by _classify_peps
+CATEGORY_TITLES = (
+    "Process and Meta-PEPs",
+    "Other Informational PEPs",
+    "Provisional PEPs (provisionally accepted; interface may still change)",
+    "Accepted PEPs (accepted; may not be implemented yet)",
+    "Open PEPs (under consideration)",
+    "Finished PEPs (done, with a stable interface)",
+    "Historical Meta-PEPs and Informational PEPs",
+    "Deferred PEPs (postponed pending further research or updates)",
+    "Rejected, Superseded, and Withdrawn PEPs",
+)
+_META, _INFO, _PROVISIONAL, _ACCEPTED, _OPEN, _FINISHED, _HISTORICAL, _DEFERRED, _DEAD = range(len(CATEGORY_TITLES))
+
+
+class PEPBucket:
+    """PEPs in an index page, and the same PEPs grouped by category."""
+
+    def __init__(self):
+        self.peps: list[PEP] = []
+        self.categories: tuple[list[PEP], ...] = tuple([] for _ in CATEGORY_TITLES)
+
+    def add(self, pep: PEP, category: int) -> None:
+        self.peps.append(pep)
+        self.categories[category].append(pep)
+
+
+def bucket_peps(peps: Iterable[PEP], topics: Iterable[str]) -> tuple[PEPBucket, dict[str, PEPBucket]]:
+    """Group PEPs for PEP 0 and for each topic sub-index in a single pass."""
+    all_peps = PEPBucket()
+    by_topic = {topic.lower(): PEPBucket() for topic in topics}
+    for pep in peps:
+        category = _pep_category(pep)
+        all_peps.add(pep, category)
+        for topic in pep.topic:
+            if topic in by_topic:
+                by_topic[topic].add(pep, category)
+    return all_peps, by_topic
+
+
 class PEPZeroWriter:
     # This is a list of reserved PEP numbers.  Reservations are not to be used for
     # the normal PEP number allocation process - just give out the next available
@@ -112,13 +155,16 @@ class PEPZeroWriter:
         self.emit_title(text, symbol="-")
 
     def emit_table(self, peps: list[PEP]) -> None:
-        include_version = any(pep.details["python_version"] for pep in peps)
+        include_version = any(pep.python_version for pep in peps)
         self.emit_column_headers(include_version=include_version)
         for pep in peps:
-            details = pep.details
-            if not include_version:
-                details.pop("python_version")
-            self.emit_pep_row(**details)
+            self.emit_pep_row(
+                shorthand=pep.shorthand,
+                number=pep.number,
+                title=pep.title,
+                authors=pep.joined_authors,
+                python_version=(pep.python_version or "") if include_version else None,
+            )
 
     def emit_pep_category(self, category: str, peps: list[PEP]) -> None:
         self.emit_subtitle(category)
@@ -151,6 +197,7 @@ class PEPZeroWriter:
         intro: str = INTRO,
         is_pep0: bool = True,
         builder: str = None,
+        categories: Sequence[list[PEP]] | None = None,
     ) -> str:
         if len(peps) == 0:
             return ""
@@ -199,18 +246,9 @@ class PEPZeroWriter:
 
         # PEPs by category
         self.emit_title("Index by Category")
-        meta, info, provisional, accepted, open_, finished, historical, deferred, dead = _classify_peps(peps)
-        pep_categories = [
-            ("Process and Meta-PEPs", meta),
-            ("Other Informational PEPs", info),
-            ("Provisional PEPs (provisionally accepted; interface may still change)", provisional),
-            ("Accepted PEPs (accepted; may not be implemented yet)", accepted),
-            ("Open PEPs (under consideration)", open_),
-            ("Finished PEPs (done, with a stable interface)", finished),
-            ("Historical Meta-PEPs and Informational PEPs", historical),
-            ("Deferred PEPs (postponed pending further research or updates)", deferred),
-            ("Rejected, Superseded, and Withdrawn PEPs", dead),
-        ]
+        if categories is None:
+            categories = _classify_peps(peps)
+        pep_categories = zip(CATEGORY_TITLES, categories)
         for (category, peps_in_category) in pep_categories:
             # For sub-indices, only emit categories with entries.
             # For PEP 0, emit every category, but only with a table when it has entries.
@@ -286,48 +324,42 @@ class PEPZeroWriter:
 def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
     """Sort PEPs into meta, informational, accepted, open, finished,
     and essentially dead."""
-    meta = []
-    info = []
-    provisional = []
-    accepted = []
-    open_ = []
-    finished = []
-    historical = []
-    deferred = []
-    dead = []
+    categories = tuple([] for _ in CATEGORY_TITLES)
     for pep in peps:
-        # Order of 'if' statement important.  Key Status values take precedence
-        # over Type value, and vice-versa.
-        if pep.status == STATUS_DRAFT:
-            open_.append(pep)
-        elif pep.status == STATUS_DEFERRED:
-            deferred.append(pep)
-        elif pep.pep_type == TYPE_PROCESS:
-            if pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
-                meta.append(pep)
-            elif pep.status in {STATUS_WITHDRAWN, STATUS_REJECTED}:
-                dead.append(pep)
-            else:
-                historical.append(pep)
-        elif pep.status in DEAD_STATUSES:
-            dead.append(pep)
-        elif pep.pep_type == TYPE_INFO:
-            # Hack until the conflict between the use of "Final"
-            # for both API definition PEPs and other (actually
-            # obsolete) PEPs is addressed
-            if pep.status == STATUS_ACTIVE or "release schedule" not in pep.title.lower():
-                info.append(pep)
-            else:
-                historical.append(pep)
-        elif pep.status == STATUS_PROVISIONAL:
-            provisional.append(pep)
-        elif pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
-            accepted.append(pep)
-        elif pep.status == STATUS_FINAL:
-            finished.append(pep)
-        else:
-            raise PEPError(f"Unsorted ({pep.pep_type}/{pep.status})", pep.filename, pep.number)
-    return meta, info, provisional, accepted, open_, finished, historical, deferred, dead
+        categories[_pep_category(pep)].append(pep)
+    return categories
+
+
+def _pep_category(pep: PEP) -> int:
+    """Return the index of the PEP's category in CATEGORY_TITLES."""
+    # Order of 'if' statement important.  Key Status values take precedence
+    # over Type value, and vice-versa.
+    if pep.status == STATUS_DRAFT:
+        return _OPEN
+    if pep.status == STATUS_DEFERRED:
+        return _DEFERRED
+    if pep.pep_type == TYPE_PROCESS:
+        if pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+            return _META
+        if pep.status in {STATUS_WITHDRAWN, STATUS_REJECTED}:
+            return _DEAD
+        return _HISTORICAL
+    if pep.status in DEAD_STATUSES:
+        return _DEAD
+    if pep.pep_type == TYPE_INFO:
+        # Hack until the conflict between the use of "Final"
+        # for both API definition PEPs and other (actually
+        # obsolete) PEPs is addressed
+        if pep.status == STATUS_ACTIVE or "release schedule" not in pep.title.lower():
+            return _INFO
+        return _HISTORICAL
+    if pep.status == STATUS_PROVISIONAL:
+        return _PROVISIONAL
+    if pep.status in {STATUS_ACCEPTED, STATUS_ACTIVE}:
+        return _ACCEPTED
+    if pep.status == STATUS_FINAL:
+        return _FINISHED
+    raise PEPError(f"Unsorted ({pep.pep_type}/{pep.status})", pep.filename, pep.number)
 
 
 def _verify_email_addresses(peps: list[PEP]) -> dict[str, str]:
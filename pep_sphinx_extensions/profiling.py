@@ -0,0 +1,201 @@
+"""Profile where the time and memory of a PEP build go, for "build.py --profile".
+
+The build is split into phases at Sphinx events, and each document is
+timed as it is read (parsing and the PEP transforms) and written (post
+transforms, the PEP translator and the page template). The PEP transforms
+and the handlers for the busiest events are also timed in total.
+
+Memory is measured with tracemalloc, as the bytes still allocated at the
+end of each phase or document, and the peak above the start. Tracing
+slows the build, so times are best compared with each other, not with
+unprofiled builds. Documents must be read and written in this process,
+so the build must not be parallel.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from pep_sphinx_extensions.pep_processor.parsing import pep_parser
+from pep_sphinx_extensions.pep_processor.transforms import pep_references
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from docutils import nodes
+    from sphinx.application import Sphinx
+
+# Events at which each phase starts, and the priority of the handler which
+# marks it, to include (0) or exclude (999) the other handlers for the event
+PHASE_EVENTS = (
+    ("env-before-read-docs", 0, "generate-indices"),  # create_pep_zero
+    ("env-before-read-docs", 999, "read"),
+    ("env-updated", 999, "save-environment"),
+    ("env-check-consistency", 999, "write"),
+    ("build-finished", 0, "post-build"),  # create_rss_feed
+)
+# Events whose handlers are timed in total, e.g. set_description
+HANDLER_EVENTS = ("doctree-read", "html-page-context")
+
+TOP_DOCUMENTS = 10
+
+
+@dataclasses.dataclass
+class Measurement:
+    """Wall time and memory use, summed over one or more calls."""
+    calls: int = 0
+    seconds: float = 0.0
+    allocated: int = 0  # bytes still allocated at the end
+    peak: int = 0  # the highest peak above the start, in bytes
+
+
+class BuildProfiler:
+    """Record the time and memory used by each phase of a build, and each document."""
+
+    def __init__(self, app: Sphinx) -> None:
+        self.phases: dict[str, Measurement] = {}
+        self.handlers: dict[str, Measurement] = {event: Measurement() for event in HANDLER_EVENTS}
+        self.transforms: dict[str, Measurement] = {}
+        self.documents: dict[str, dict[str, Measurement]] = {}
+
+        # The highest traced memory since the last reset, as peaks are reset per document
+        self._peak = 0
+        self._phase: str | None = "find-sources"
+        self._phase_start = self._start()
+        self._document_start: tuple[float, int] | None = None
+        self._handler_started: dict[str, float] = {}
+
+        for event, priority, phase in PHASE_EVENTS:
+            if phase == "generate-indices" and "single_pep" in app.tags:
+                continue  # "build.py --pep" doesn't generate the indices
+            app.connect(event, lambda *_args, phase=phase: self._start_phase(phase), priority=priority)
+        app.connect("build-finished", lambda *_args: self._start_phase(None), priority=999)
+        for event in HANDLER_EVENTS:
+            app.connect(event, lambda *_args, event=event: self._start_handlers(event), priority=0)
+            app.connect(event, lambda *_args, event=event: self._end_handlers(event), priority=999)
+        app.connect("source-read", lambda _app, docname, _source: self._start_document())
+        app.connect("doctree-read", self._end_read, priority=999)
+
+        # No event marks the start of writing a document, so wrap the builder
+        write_doc = app.builder.write_doc
+
+        def profiled_write_doc(docname: str, doctree: nodes.document) -> None:
+            self._start_document()
+            write_doc(docname, doctree)
+            self._end_document(docname, "write")
+
+        app.builder.write_doc = profiled_write_doc
+
+        self._original_transforms: dict[type, Callable] = {}
+        for transform in (*pep_parser.PEPParser().get_transforms(), pep_references.PEPReferenceRoleTitleText):
+            self._profile_transform(transform)
+
+    def close(self) -> None:
+        """Stop tracing memory, and restore the PEP transforms."""
+        tracemalloc.stop()
+        for transform, apply in self._original_transforms.items():
+            transform.apply = apply
+
+    def report(self) -> dict[str, object]:
+        """The measurements, as JSON-serialisable data."""
+        return {
+            "phases": _as_dicts(self.phases),
+            "handlers": _as_dicts(self.handlers),
+            "transforms": _as_dicts(self.transforms),
+            "documents": {docname: _as_dicts(steps) for docname, steps in sorted(self.documents.items())},
+        }
+
+    def write_report(self, path: Path) -> None:
+        path.write_text(json.dumps(self.report(), indent=1), encoding="utf-8")
+
+    def print_summary(self, top: int = TOP_DOCUMENTS) -> None:
+        """Print the phases, and the slowest documents."""
+        print(f"{'Phase':<24} {'Seconds':>8} {'Allocated MiB':>14} {'Peak MiB':>9}")
+        for phase, measurement in self.phases.items():
+            print(
+                f"{phase:<24} {measurement.seconds:>8.2f} "
+                f"{_mib(measurement.allocated):>14.1f} {_mib(measurement.peak):>9.1f}"
+            )
+        print()
+
+        totals = {
+            docname: sum(measurement.seconds for measurement in steps.values())
+            for docname, steps in self.documents.items()
+        }
+        slowest = sorted(totals, key=totals.__getitem__, reverse=True)[:top]
+        print(f"{f'Slowest {len(slowest)} documents':<24} {'Read ms':>8} {'Write ms':>9} {'Total ms':>9} {'Peak MiB':>9}")
+        for docname in slowest:
+            read = self.documents[docname].get("read", Measurement())
+            write = self.documents[docname].get("write", Measurement())
+            print(
+                f"{docname:<24} {read.seconds * 1000:>8.0f} {write.seconds * 1000:>9.0f} "
+                f"{totals[docname] * 1000:>9.0f} {_mib(max(read.peak, write.peak)):>9.1f}"
+            )
+
+    def _start(self) -> tuple[float, int]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        return time.perf_counter(), current
+
+    def _measure(self, start: tuple[float, int], measurement: Measurement, *, peak: int = 0) -> None:
+        seconds = time.perf_counter() - start[0]
+        current, traced_peak = tracemalloc.get_traced_memory()
+        measurement.calls += 1
+        measurement.seconds += seconds
+        measurement.allocated += current - start[1]
+        measurement.peak = max(measurement.peak, max(peak, traced_peak) - start[1])
+
+    def _start_phase(self, phase: str | None) -> None:
+        # Include the peaks of any documents in the phase
+        self._measure(self._phase_start, self.phases.setdefault(self._phase, Measurement()), peak=self._peak)
+        self._peak = 0
+        self._phase = phase
+        self._phase_start = self._start()
+
+    def _start_handlers(self, event: str) -> None:
+        self._handler_started[event] = time.perf_counter()
+
+    def _end_handlers(self, event: str) -> None:
+        measurement = self.handlers[event]
+        measurement.calls += 1
+        measurement.seconds += time.perf_counter() - self._handler_started.pop(event)
+
+    def _start_document(self) -> None:
+        self._document_start = self._start()
+
+    def _end_read(self, app: Sphinx, _doctree: nodes.document) -> None:
+        self._end_document(app.env.docname, "read")
+
+    def _end_document(self, docname: str, step: str) -> None:
+        if self._document_start is None:
+            return
+        self._measure(self._document_start, self.documents.setdefault(docname, {}).setdefault(step, Measurement()))
+        self._document_start = None
+
+    def _profile_transform(self, transform: type) -> None:
+        apply = self._original_transforms[transform] = transform.apply
+        measurement = self.transforms[transform.__name__] = Measurement()
+
+        def profiled_apply(transform_self, **kwargs) -> None:
+            started = time.perf_counter()
+            apply(transform_self, **kwargs)
+            measurement.calls += 1
+            measurement.seconds += time.perf_counter() - started
+
+        transform.apply = profiled_apply
+
+
+def _as_dicts(measurements: dict[str, Measurement]) -> dict[str, dict[str, float]]:
+    return {name: dataclasses.asdict(measurement) for name, measurement in measurements.items()}
+
+
+def _mib(size: int) -> float:
+    return size / (1024 * 1024)
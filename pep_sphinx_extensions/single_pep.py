@@ -0,0 +1,48 @@
+"""Render a single PEP, for "build.py --pep".
+
+The PEP is the root document, and only it (with its ancillary files) is
+read, along with the PEPs it links to, which are needed for title text.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pep_sphinx_extensions.pep_processor.transforms.pep_references import pep_role_references
+
+if TYPE_CHECKING:
+    from docutils import nodes
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+
+def prune_docs_to_read(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
+    """Read only the PEP being rendered, and the linked PEPs already read."""
+    root_doc = app.config.master_doc
+    # Linked PEPs read by a previous run are re-read if changed, to keep titles current
+    docnames[:] = [
+        docname for docname in docnames
+        if docname == root_doc or docname.startswith(f"{root_doc}/") or docname in env.all_docs
+    ]
+
+
+def record_linked_peps(app: Sphinx, doctree: nodes.document) -> None:
+    """Store the PEPs that :pep: roles in the PEP being rendered link to."""
+    if app.env.docname != app.config.master_doc:
+        return
+    app.env.pep_linked_docnames = {
+        f"pep-{node['_title_tuple'][0]:0>4}" for node in pep_role_references(doctree)
+    }
+
+
+def read_linked_peps(app: Sphinx, env: BuildEnvironment) -> list[str]:
+    """Read the linked PEPs which haven't been read, for PEPReferenceRoleTitleText."""
+    docnames = sorted(
+        docname for docname in getattr(env, "pep_linked_docnames", ())
+        if docname not in env.all_docs and docname in env.found_docs
+    )
+    for docname in docnames:
+        app.builder.read_doc(docname)
+        # Only read for their titles, so they aren't in any toctree
+        env.metadata[docname]["orphan"] = True
+    return docnames
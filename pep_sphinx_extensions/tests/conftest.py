@@ -10,3 +10,8 @@ CHECK_PEPS_PATH = _ROOT_PATH / "check-peps.py"
 spec = importlib.util.spec_from_file_location("check_peps", CHECK_PEPS_PATH)
 sys.modules["check_peps"] = check_peps = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(check_peps)
+
+# Import "benchmark-check-peps.py" as "benchmark_check_peps"
+spec = importlib.util.spec_from_file_location("benchmark_check_peps", _ROOT_PATH / "benchmark-check-peps.py")
+sys.modules["benchmark_check_peps"] = benchmark_check_peps = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark_check_peps)
@@ -0,0 +1,30 @@
+import benchmark_check_peps as benchmark  # NoQA: inserted into sys.modules in conftest.py
+
+from ..conftest import PEP_ROOT
+
+
+def test_corpus_inputs():
+    inputs = benchmark.corpus_inputs([PEP_ROOT / "pep-0008.rst"])
+
+    assert len(inputs["headers"][1]) == 1
+    assert len(inputs["header-author"][1]) == 1
+    # One call per author
+    assert len(inputs["_email"][1]) == 3
+    assert inputs["_date"][1][0] == ((8, "05-Jul-2001", "Created"), {})
+
+
+def test_benchmark(monkeypatch):
+    monkeypatch.setattr(benchmark, "MIN_ROUND_SECONDS", 0)
+    inputs = benchmark.synthetic_inputs()
+
+    results = benchmark.benchmark(inputs, rounds=1)
+
+    assert results.keys() == inputs.keys()
+    assert all(seconds > 0 for seconds in results.values())
+
+
+def test_regressions():
+    baseline = {"a": 1.0, "b": 1.0, "removed": 1.0}
+    results = {"a": 1.4, "b": 1.6, "added": 9.0}
+
+    assert benchmark.regressions(results, baseline, tolerance=1.5) == ["b"]
@@ -28,3 +28,20 @@ def test_check_direct_links_pep(line: str):
 def test_check_direct_links_rfc(line: str):
     warnings = [warning for (_, warning) in check_peps.check_direct_links(1, line)]
     assert warnings == ["Use the :rfc:`NNN` role to refer to RFCs"], warnings
+
+
+def test_check_direct_links_text():
+    text = (
+        "PEP: 9999\n"
+        "\n"
+        "See https://datatracker.ietf.org/doc/html/rfc2324 and "
+        "https://PEPS.python.org/pep-0008/ or https://peps.python.org/pep-0009/\n"
+        "Nothing here\n"
+        "https://www.rfc-editor.org/rfc/rfc2324\n"
+    )
+    warnings = list(check_peps._check_direct_links_text(text))
+    assert warnings == [
+        ("direct-pep-link", 3, "Use the :pep:`NNN` role to refer to PEPs"),
+        ("direct-rfc-link", 3, "Use the :rfc:`NNN` role to refer to RFCs"),
+        ("direct-rfc-link", 5, "Use the :rfc:`NNN` role to refer to RFCs"),
+    ]
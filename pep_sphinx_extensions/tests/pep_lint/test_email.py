@@ -236,3 +236,20 @@ def test_email_checker(email: str, expected_warnings: set):
         assert warnings == [], warnings
 
     assert found_warnings == expected_warnings
+
+
+def test_email_cache():
+    check_peps._email_errors.cache_clear()
+    author = "Cardinal Ximénez <Cardinal.Ximenez@spanish.inquisition>"
+
+    list(check_peps._email(1, author, "Author"))
+    warnings = list(check_peps._email(2, f" {author} ", "Sponsor"))
+    warnings += list(check_peps._email(3, "Alice <alice>", "Author"))
+    warnings += list(check_peps._email(4, "Alice <alice>", "Author"))
+
+    assert warnings == [
+        (3, "Author entries must contain a valid email address: 'Alice <alice>'"),
+        (4, "Author entries must contain a valid email address: 'Alice <alice>'"),
+    ]
+    cache_info = check_peps._email_errors.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
@@ -0,0 +1,71 @@
+import check_peps  # NoQA: inserted into sys.modules in conftest.py
+
+
+def _reference_errors(graph):
+    return [(pep_number, line_num, msg) for pep_number, _, line_num, msg in check_peps._check_references(graph)]
+
+
+def test_check_references():
+    graph = {
+        1: {"Superseded-By": (8, [2])},
+        2: {"Replaces": (8, [1]), "Requires": (6, [3, 9999])},
+        3: {},
+        4: {"Replaces": (8, [3])},
+    }
+
+    errors = _reference_errors(graph)
+
+    assert errors == [
+        (2, 6, "Requires must only reference existing PEPs: PEP 9999 does not exist"),
+        (4, 8, "Replaces references PEP 3, whose Superseded-By header must reference this PEP"),
+    ]
+
+
+def test_check_references_rules():
+    graph = {1: {"Superseded-By": (8, [2])}, 2: {}}
+
+    rules = [rule for _, rule, _, _ in check_peps._check_references(graph)]
+
+    assert rules == ["graph-missing-replaces"]
+
+
+def test_check_references_cycles():
+    graph = {
+        1: {"Requires": (6, [2])},
+        2: {"Requires": (6, [3])},
+        3: {"Requires": (7, [1, 4])},
+        4: {"Requires": (6, [5])},
+        5: {},
+        6: {"Requires": (6, [6])},
+    }
+
+    errors = _reference_errors(graph)
+
+    assert errors == [
+        (1, 6, "Requires must not form a cycle: PEPs 1, 2, 3"),
+        (6, 6, "Requires must not form a cycle: PEPs 6"),
+    ]
+
+
+def test_reference_cycles_long_chain():
+    # A long chain must not hit the recursion limit
+    graph = {number: {"Requires": (6, [number + 1])} for number in range(1, 5000)}
+    graph[5000] = {"Requires": (6, [1])}
+
+    cycles = check_peps._reference_cycles(graph, "Requires")
+
+    assert cycles == [list(range(1, 5001))]
+
+
+def test_check_graph(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(check_peps, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(check_peps, "PEP_ROOT", tmp_path / "peps")
+    check_peps.PEP_ROOT.mkdir()
+    (check_peps.PEP_ROOT / "pep-0001.rst").write_text("PEP: 1\nSuperseded-By: 2\n\nBody\n", encoding="utf-8")
+    (check_peps.PEP_ROOT / "pep-0002.rst").write_text("PEP: 2\nRequires: 3\n\nBody\n", encoding="utf-8")
+
+    assert check_peps.check_graph([check_peps.PEP_ROOT / "pep-0001.rst"]) == 1
+    out = capsys.readouterr().out
+    assert out.splitlines() == [
+        "peps/pep-0001.rst:2:  Superseded-By references PEP 2, whose Replaces header must reference this PEP",
+    ]
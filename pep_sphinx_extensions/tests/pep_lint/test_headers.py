@@ -48,21 +48,21 @@ def test_header_pattern_no_match(test_input):
     assert check_peps.HEADER_PATTERN.match(test_input) is None
 
 
-def test_validate_required_headers():
-    found_headers = dict.fromkeys(
-        ("PEP", "Title", "Author", "Status", "Type", "Created")
-    )
-    warnings = [
-        warning for (_, warning) in check_peps._validate_required_headers(found_headers)
+def _required_header_warnings(headers):
+    lines = [f"{header}: value" for header in headers]
+    return [
+        warning for (rule, _, warning) in check_peps._check_headers(lines)
+        if rule in {"header-required", "header-order"}
     ]
+
+
+def test_validate_required_headers():
+    warnings = _required_header_warnings(("PEP", "Title", "Author", "Status", "Type", "Created"))
     assert warnings == [], warnings
 
 
 def test_validate_required_headers_missing():
-    found_headers = dict.fromkeys(("PEP", "Title", "Author", "Type"))
-    warnings = [
-        warning for (_, warning) in check_peps._validate_required_headers(found_headers)
-    ]
+    warnings = _required_header_warnings(("PEP", "Title", "Author", "Type"))
     assert warnings == [
         "Must have required header: Status",
         "Must have required header: Created",
@@ -70,12 +70,9 @@ def test_validate_required_headers_missing():
 
 
 def test_validate_required_headers_order():
-    found_headers = dict.fromkeys(
+    warnings = _required_header_warnings(
         ("PEP", "Title", "Sponsor", "Author", "Type", "Status", "Replaces", "Created")
     )
-    warnings = [
-        warning for (_, warning) in check_peps._validate_required_headers(found_headers)
-    ]
     assert warnings == [
         "Headers must be in PEP 12 order. Correct order: PEP, Title, Author, Sponsor, Status, Type, Created, Replaces"
     ], warnings
@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 
 import check_peps  # NoQA: inserted into sys.modules in conftest.py
@@ -52,3 +54,202 @@ def test_skip_direct_pep_link_check():
     content = filename.read_text(encoding="utf-8").splitlines()
     warnings = list(check_peps.check_peps(filename, content))
     assert warnings == []
+
+
+def test_check_cache(tmp_path, capsys):
+    cache_file = tmp_path / "cache.json"
+    filename = PEP_ROOT / "pep-0008.rst"
+
+    assert check_peps.check([filename], cache_file=cache_file) == 0
+    assert check_peps._read_cache(cache_file) == {
+        str(filename): check_peps._content_digest(filename)
+    }
+
+    # Failing PEPs are not recorded as clean
+    assert check_peps.check([PEP_9002], cache_file=cache_file) == 1
+    assert str(PEP_9002) not in check_peps._read_cache(cache_file)
+    capsys.readouterr()
+
+
+def test_check_cache_skips_clean(tmp_path, monkeypatch):
+    cache_file = tmp_path / "cache.json"
+    filename = PEP_ROOT / "pep-0008.rst"
+    check_peps._write_cache(cache_file, {str(filename): check_peps._content_digest(filename)})
+    checked = []
+    monkeypatch.setattr(check_peps, "check_file", lambda filename, *_args: checked.append(filename) or 0)
+
+    check_peps.check([filename, PEP_ROOT / "pep-0009.rst"], cache_file=cache_file)
+
+    assert checked == [PEP_ROOT / "pep-0009.rst"]
+
+
+def test_check_cache_invalidated(tmp_path, monkeypatch):
+    cache_file = tmp_path / "cache.json"
+    filename = PEP_ROOT / "pep-0008.rst"
+    check_peps._write_cache(cache_file, {str(filename): check_peps._content_digest(filename)})
+
+    monkeypatch.setattr(check_peps, "CHECKER_DIGEST", "changed")
+
+    assert check_peps._read_cache(cache_file) == {}
+
+
+def test_checker_digest_sources():
+    sources = {source.name for source in check_peps.CHECKER_SOURCES}
+
+    # Checks in the shared package also invalidate the cache when changed
+    assert {"check-peps.py", "headers.py", "thread_urls.py"} <= sources
+
+
+def test_check_jobs(capsys, monkeypatch):
+    monkeypatch.setattr(check_peps.os, "cpu_count", lambda: 2)
+
+    assert check_peps.check([PEP_9002], jobs=1) == 1
+    serial = capsys.readouterr()
+    assert check_peps.check([PEP_9002, PEP_ROOT / "pep-0008.rst"], jobs=2) == 1
+    parallel = capsys.readouterr()
+
+    assert parallel == serial
+
+
+def test_check_jobs_timings(capsys, monkeypatch):
+    monkeypatch.setattr(check_peps.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(check_peps, "SHOW_TIMINGS", True)
+    # Enough PEPs that each worker is sent several at a time
+    filenames = check_peps._all_peps()[:24]
+
+    monkeypatch.setattr(check_peps, "RULE_CALLS", check_peps.Counter())
+    check_peps.check(filenames, jobs=1)
+    serial = check_peps.RULE_CALLS
+    monkeypatch.setattr(check_peps, "RULE_CALLS", check_peps.Counter())
+    check_peps.check(filenames, jobs=2)
+
+    assert check_peps.RULE_CALLS == serial
+    assert serial["header-title"] == 24
+
+
+def test_no_timings_by_default(monkeypatch):
+    monkeypatch.setattr(check_peps, "RULE_CALLS", check_peps.Counter())
+
+    check_peps.check([PEP_ROOT / "pep-0008.rst"])
+
+    assert not check_peps.RULE_CALLS
+
+
+def test_output_jsonl(capsys, monkeypatch):
+    monkeypatch.setattr(check_peps, "OUTPUT_FORMAT", "jsonl")
+
+    assert check_peps.check([PEP_9002]) == 1
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 28
+    assert records[0] == {
+        "file": "pep_sphinx_extensions/tests/peps/pep-9002.rst",
+        "line": 1,
+        "rule": "header-pep",
+        "message": "PEP must begin with the 'PEP:' header",
+    }
+    assert records[-1]["rule"] == "direct-pep-link"
+
+
+def test_output_sarif(capsys, monkeypatch):
+    monkeypatch.setattr(check_peps, "OUTPUT_FORMAT", "sarif")
+    monkeypatch.setattr(check_peps, "DETAILED_ERRORS", True)
+
+    assert check_peps.check([PEP_9002, PEP_ROOT / "pep-0008.rst"]) == 1
+
+    log = json.loads(capsys.readouterr().out)
+    results = log["runs"][0]["results"]
+    assert len(results) == 28
+    assert results[1] == {
+        "ruleId": "header-invalid",
+        "level": "error",
+        "message": {"text": "Must not have invalid header: Version"},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": "pep_sphinx_extensions/tests/peps/pep-9002.rst"},
+            "region": {"startLine": 6, "snippet": {"text": "Version: 4.0"}},
+        }}],
+    }
+
+
+def test_output_sarif_repeated(capsys, monkeypatch):
+    monkeypatch.setattr(check_peps, "OUTPUT_FORMAT", "sarif")
+
+    # Each run writes a complete log, with no leading comma before its first result
+    for _ in range(2):
+        assert check_peps.check([PEP_9002]) == 1
+        log = json.loads(capsys.readouterr().out)
+        assert len(log["runs"][0]["results"]) == 28
+
+
+def test_watch_modified_files(tmp_path):
+    filename = tmp_path / "pep-9999.rst"
+    filename.write_text("PEP: 9999\n", encoding="utf-8")
+    mtimes = {}
+
+    assert check_peps._modified_files([filename], mtimes) == [filename]
+    assert check_peps._modified_files([filename], mtimes) == []
+
+    os.utime(filename, ns=(0, 0))
+    assert check_peps._modified_files([filename], mtimes) == [filename]
+
+    # Removed files are reported once
+    filename.unlink()
+    assert check_peps._modified_files([filename], mtimes) == [filename]
+    assert check_peps._modified_files([filename], mtimes) == []
+
+
+def test_watch_modified_files_removed_while_listing(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_peps, "PEP_ROOT", tmp_path)
+    (tmp_path / "pep-0001.rst").write_text("PEP: 1\n", encoding="utf-8")
+    # Listed in the directory, but gone by the time it is examined
+    (tmp_path / "pep-0002.rst").symlink_to(tmp_path / "missing.rst")
+
+    assert check_peps._modified_files([], {}) == [tmp_path / "pep-0001.rst"]
+
+
+def test_generated_peps_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_peps, "PEP_ROOT", tmp_path)
+    for name in "pep-0000.rst", "pep-0001.rst":
+        (tmp_path / name).write_text("PEP: 1\n", encoding="utf-8")
+
+    assert check_peps._all_peps() == [tmp_path / "pep-0001.rst"]
+    assert check_peps._modified_files([], {}) == [tmp_path / "pep-0001.rst"]
+
+
+def test_watch_error_difference():
+    old = [("header-title", 2, "PEP must have a title"), ("header-status", 5, "Status must be a valid PEP status")]
+    # Lines inserted above an unchanged error are not reported
+    new = [("header-title", 3, "PEP must have a title"), ("header-type", 7, "Type must be a valid PEP type")]
+
+    assert check_peps._error_difference(new, old) == [("header-type", 7, "Type must be a valid PEP type")]
+    assert check_peps._error_difference(old, new) == [("header-status", 5, "Status must be a valid PEP status")]
+
+
+def test_header_validators_registry():
+    assert check_peps.HEADER_VALIDATORS["Title"] is check_peps._validate_title
+    assert check_peps.HEADER_VALIDATORS["PEP-Delegate"] is check_peps._validate_delegate
+    assert "header-post-history" in check_peps.all_rules()
+
+
+def test_disabled_rules(monkeypatch):
+    monkeypatch.setattr(check_peps, "DISABLED_RULES", frozenset({"header-invalid", "direct-pep-link"}))
+    content = PEP_9002.read_text(encoding="utf-8").splitlines()
+
+    warnings = list(check_peps.check_peps(PEP_9002, content))
+
+    assert len(warnings) == 24
+    assert (6, "Must not have invalid header: Version") not in warnings
+    assert (23, "Use the :pep:`NNN` role to refer to PEPs") not in warnings
+
+
+def test_enabled_rules(monkeypatch):
+    monkeypatch.setattr(check_peps, "ENABLED_RULES", frozenset({"header-topic"}))
+    monkeypatch.setattr(check_peps, "SHOW_TIMINGS", True)
+    monkeypatch.setattr(check_peps, "RULE_CALLS", check_peps.Counter())
+    content = PEP_9002.read_text(encoding="utf-8").splitlines()
+
+    warnings = list(check_peps.check_peps(PEP_9002, content))
+
+    assert [line_num for line_num, _ in warnings] == [14, 14, 14, 14]
+    # Other rules are not run at all
+    assert check_peps.RULE_CALLS == {"header-topic": 1}
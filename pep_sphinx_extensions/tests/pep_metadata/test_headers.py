@@ -0,0 +1,61 @@
+import pytest
+
+from pep_metadata import headers
+
+from ..conftest import PEP_ROOT
+
+
+def test_tokenize_headers():
+    lines = [
+        "PEP: 9999",
+        "Title: Example",
+        "Author: Alice <alice@example.com>,",
+        "        Bob <bob@example.com>",
+        "Post-History:",
+        "Status:  Draft  ",
+        "",
+        "Body: not a header",
+    ]
+
+    out = headers.tokenize_headers(lines)
+
+    assert out == [
+        headers.Header("PEP", "9999", 1),
+        headers.Header("Title", "Example", 2),
+        headers.Header("Author", "Alice <alice@example.com>,\n        Bob <bob@example.com>", 3),
+        headers.Header("Post-History", "", 5),
+        headers.Header("Status", "Draft  ", 6),
+    ]
+
+
+def test_tokenize_headers_invalid_lines():
+    # Lines which are not headers continue the previous header
+    lines = ["PEP:9999", "Title: Example", "Title:Example", "title: lower case"]
+
+    out = headers.tokenize_headers(lines)
+
+    assert out == [
+        headers.Header("Title", "Example\nTitle:Example", 2),
+        headers.Header("title", "lower case", 4),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("PEP: 1\nTitle: A\n", ["PEP: 1", "Title: A"]),
+        ("PEP: 1\n  \nBody\n", ["PEP: 1", "  "]),
+        ("PEP: 1\nTitle: A", ["PEP: 1", "Title: A"]),
+    ],
+)
+def test_header_lines(text: str, expected: list[str]):
+    assert headers.header_lines(text) == expected
+
+
+def test_read_header_lines():
+    lines = headers.read_header_lines(PEP_ROOT / "pep-0008.rst")
+
+    assert lines[:2] == ["PEP: 8", "Title: Style Guide for Python Code"]
+    assert "" not in lines
+    assert "Introduction" not in lines
@@ -0,0 +1,114 @@
+import pytest
+
+from pep_metadata.thread_urls import ThreadURL
+from pep_metadata.thread_urls import classify_thread_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://discuss.python.org/t/thread-name/123456",
+            ThreadURL("discourse", "thread", "thread-name", "123456"),
+        ),
+        (
+            "https://discuss.python.org/t/123456/",
+            ThreadURL("discourse", "thread", "", "123456"),
+        ),
+        (
+            "https://discuss.python.org/t/thread-name/123456/7",
+            ThreadURL("discourse", "message", "thread-name", "123456", "7"),
+        ),
+        (
+            "https://discuss.python.org/c/peps/19",
+            ThreadURL("discourse", "category", "peps"),
+        ),
+        (
+            "https://mail.python.org/pipermail/python-dev/2012-May/119876.html",
+            ThreadURL("pipermail", "message", "python-dev", None, "119876"),
+        ),
+        (
+            "https://mail.python.org/pipermail/import-sig/",
+            ThreadURL("pipermail", "list", "import-sig"),
+        ),
+        (
+            "https://mail.python.org/archives/list/list-name@python.org/thread/abcXYZ123",
+            ThreadURL("hyperkitty", "thread", "list-name", "abcXYZ123"),
+        ),
+        (
+            "https://mail.python.org/archives/list/list-name@python.org/message/abcXYZ123/#anchor",
+            ThreadURL("hyperkitty", "message", "list-name", None, "abcXYZ123"),
+        ),
+        (
+            "https://mail.python.org/mailman3/lists/python-dev.python.org/",
+            ThreadURL("mailman3", "list", "python-dev"),
+        ),
+        (
+            "https://mail.python.org/mailman/listinfo/db-sig",
+            ThreadURL("listinfo", "list", "db-sig"),
+        ),
+    ],
+)
+def test_classify_thread_url(url: str, expected: ThreadURL):
+    assert classify_thread_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/t/thread-name/123456",
+        "https://discuss.python.org/t/thread-name",
+        "https://discuss.python.org/t/thread-name/123abc",
+        "https://discuss.python.org/t/123/456/789",
+        "https://discuss.python.org/latest",
+        "HTTPS://DISCUSS.PYTHON.ORG/T/123456",
+        "https://mail.python.org/pipermail/python-dev/2012-May",
+        "https://mail.python.org/archives/list/list-name@python.org/spam/abcXYZ123",
+        "https://example.com/",
+        "https://mail.python.org",
+        "https://discuss.python.org/",
+    ],
+)
+def test_classify_thread_url_unrecognised(url: str):
+    assert classify_thread_url(url) is None
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://discuss.python.org/t/thread-name/123456", "Discourse thread"),
+        ("https://discuss.python.org/t/thread-name/123456/7", "Discourse message"),
+        ("https://discuss.python.org/c/packaging/14", "Packaging Discourse category"),
+        ("https://discuss.python.org/c/14", "Discourse category"),
+        ("https://mail.python.org/pipermail/distutils-sig/", "Distutils-SIG list"),
+        ("https://mail.python.org/mailman/listinfo/pep-discuss", "PEP-Discuss list"),
+        ("https://mail.python.org/pipermail/python-3000/2006-November/004190.html", "Python-3000 message"),
+        (
+            "https://mail.python.org/archives/list/python-dev@python.org/thread/HW2NFOEMCVCTAFLBLC3V7MLM6ZNMKP42/",
+            "Python-Dev thread",
+        ),
+        ("https://mail.python.org/mailman3/lists/capi-sig.python.org/", "Capi-SIG list"),
+        ("https://mail.python.org/mailman/listinfo/web-sig", "Web-SIG list"),
+        ("https://discuss.python.org/c/peps/", "PEPs Discourse category"),
+    ],
+)
+def test_pretty_title(url: str, expected: str):
+    assert classify_thread_url(url).pretty_title == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://mail.python.org/pipermail/python-3000/2006-November/004190.html", ("Python-3000", "message")),
+        ("https://mail.python.org/mailman3/lists/capi-sig.python.org/", ("Capi-SIG", "list")),
+        (
+            "https://discuss.python.org/t/pep-643-metadata-for-package-source-distributions/5577",
+            ("Discourse", "thread"),
+        ),
+        ("https://discuss.python.org/c/peps/", ("PEPs Discourse", "category")),
+    ],
+)
+def test_pretty_name(url: str, expected: tuple[str, str]):
+    thread_url = classify_thread_url(url)
+
+    assert (thread_url.pretty_name, thread_url.item_type) == expected
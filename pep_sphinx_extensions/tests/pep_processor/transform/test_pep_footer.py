@@ -1,4 +1,7 @@
 import datetime as dt
+import json
+import os
+import subprocess
 
 from pep_sphinx_extensions.pep_processor.transforms import pep_footer
 
@@ -34,3 +37,92 @@ def test_get_last_modified_timestamps():
     assert len(out) >= 585
     # Should be a Unix timestamp and at least this
     assert dt.datetime.fromisoformat(out["pep-0008"]).timestamp() >= 1643124055
+
+
+def test_get_last_modified_timestamps_cache(tmp_path):
+    cache_file = tmp_path / "last-modified.json"
+
+    out = pep_footer._get_last_modified_timestamps(cache_file)
+
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached["last_modified"]["pep-0008"] == out["pep-0008"]
+
+    # HEAD is unchanged, so the cached timestamps are used as-is
+    cached["last_modified"]["pep-0008"] = "2000-01-01 00:00:00"
+    cache_file.write_text(json.dumps(cached), encoding="utf-8")
+    out = pep_footer._get_last_modified_timestamps(cache_file)
+
+    assert out["pep-0008"] == "2000-01-01 00:00:00"
+
+
+def test_get_last_modified_timestamps_corrupt_cache(tmp_path):
+    cache_file = tmp_path / "last-modified.json"
+    cache_file.write_text("{", encoding="utf-8")
+
+    out = pep_footer._get_last_modified_timestamps(cache_file)
+
+    assert out == pep_footer._get_last_modified_timestamps()
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["last_modified"]
+
+
+def test_last_modified_times_cached():
+    pep_footer.last_modified_times.cache_clear()
+
+    out = pep_footer.last_modified_times()
+
+    assert "pep-0008" in out
+    assert pep_footer.last_modified_times() is out
+
+
+def _commit(repo, date, message, commit_date=None):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com", "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com",
+        "GIT_COMMITTER_DATE": commit_date or date,
+    }
+    pep = repo / "peps" / "pep-0008.rst"
+    pep.write_text(message, encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, env=env, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], cwd=repo, env=env, check=True)
+
+
+def test_get_last_modified_timestamps_merged_older_commit(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "peps").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=repo, check=True)
+    _commit(repo, "2000-01-01T00:00:00Z", "base")
+    subprocess.run(["git", "branch", "side"], cwd=repo, check=True)
+    _commit(repo, "2003-01-01T00:00:00Z", "main")
+    monkeypatch.chdir(repo)
+    cache_file = tmp_path / "last-modified.json"
+    assert pep_footer._get_last_modified_timestamps(cache_file)["pep-0008"] == "2003-01-01 00:00:00"
+
+    # Merge a branch whose commit is older than the cached timestamp
+    subprocess.run(["git", "checkout", "-q", "side"], cwd=repo, check=True)
+    _commit(repo, "2001-01-01T00:00:00Z", "side")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com",
+         "merge", "-q", "-s", "ours", "--no-edit", "side"],
+        cwd=repo, check=True,
+    )
+
+    assert pep_footer._get_last_modified_timestamps(cache_file)["pep-0008"] == "2003-01-01 00:00:00"
+    assert pep_footer._get_last_modified_timestamps()["pep-0008"] == "2003-01-01 00:00:00"
+
+
+def test_get_last_modified_timestamps_rebased_older_commit(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "peps").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=repo, check=True)
+    _commit(repo, "2003-01-01T00:00:00Z", "base")
+    monkeypatch.chdir(repo)
+    cache_file = tmp_path / "last-modified.json"
+    assert pep_footer._get_last_modified_timestamps(cache_file)["pep-0008"] == "2003-01-01 00:00:00"
+
+    # A rebased or cherry-picked commit keeps its older author date
+    _commit(repo, "2001-01-01T00:00:00Z", "rebased", commit_date="2004-01-01T00:00:00Z")
+
+    assert pep_footer._get_last_modified_timestamps(cache_file)["pep-0008"] == "2001-01-01 00:00:00"
+    assert pep_footer._get_last_modified_timestamps()["pep-0008"] == "2001-01-01 00:00:00"
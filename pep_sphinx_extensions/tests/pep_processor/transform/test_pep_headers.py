@@ -1,3 +1,7 @@
+from docutils import frontend
+from docutils import nodes
+from docutils import utils
+from docutils.parsers.rst import Parser
 import pytest
 
 from pep_sphinx_extensions.pep_processor.transforms import pep_headers
@@ -36,98 +40,6 @@ def test_generate_list_url(test_input, expected):
     assert out == expected
 
 
-@pytest.mark.parametrize(
-    ("test_input", "expected"),
-    [
-        (
-            "https://mail.python.org/pipermail/python-3000/2006-November/004190.html",
-            ("Python-3000", "message"),
-        ),
-        (
-            "https://mail.python.org/archives/list/python-dev@python.org/thread/HW2NFOEMCVCTAFLBLC3V7MLM6ZNMKP42/",
-            ("Python-Dev", "thread"),
-        ),
-        (
-            "https://mail.python.org/mailman3/lists/capi-sig.python.org/",
-            ("Capi-SIG", "list"),
-        ),
-        (
-            "https://mail.python.org/mailman/listinfo/web-sig",
-            ("Web-SIG", "list"),
-        ),
-        (
-            "https://discuss.python.org/t/pep-643-metadata-for-package-source-distributions/5577",
-            ("Discourse", "thread"),
-        ),
-        (
-            "https://discuss.python.org/c/peps/",
-            ("PEPs Discourse", "category"),
-        ),
-    ],
-)
-def test_process_pretty_url(test_input, expected):
-    out = pep_headers._process_pretty_url(test_input)
-
-    assert out == expected
-
-
-@pytest.mark.parametrize(
-    ("test_input", "expected"),
-    [
-        (
-            "https://example.com/",
-            "https://example.com/ not a link to a recognized domain to prettify",
-        ),
-        (
-            "https://mail.python.org",
-            "https://mail.python.org not a link to a list, message or thread",
-        ),
-        (
-            "https://discuss.python.org/",
-            "https://discuss.python.org not a link to a Discourse thread or category",
-        ),
-    ],
-)
-def test_process_pretty_url_invalid(test_input, expected):
-    with pytest.raises(ValueError, match=expected):
-        pep_headers._process_pretty_url(test_input)
-
-
-@pytest.mark.parametrize(
-    ("test_input", "expected"),
-    [
-        (
-            "https://mail.python.org/pipermail/python-3000/2006-November/004190.html",
-            "Python-3000 message",
-        ),
-        (
-            "https://mail.python.org/archives/list/python-dev@python.org/thread/HW2NFOEMCVCTAFLBLC3V7MLM6ZNMKP42/",
-            "Python-Dev thread",
-        ),
-        (
-            "https://mail.python.org/mailman3/lists/capi-sig.python.org/",
-            "Capi-SIG list",
-        ),
-        (
-            "https://mail.python.org/mailman/listinfo/web-sig",
-            "Web-SIG list",
-        ),
-        (
-            "https://discuss.python.org/t/pep-643-metadata-for-package-source-distributions/5577",
-            "Discourse thread",
-        ),
-        (
-            "https://discuss.python.org/c/peps/",
-            "PEPs Discourse category",
-        ),
-    ],
-)
-def test_make_link_pretty(test_input, expected):
-    out = pep_headers._make_link_pretty(test_input)
-
-    assert out == expected
-
-
 @pytest.mark.parametrize(
     ("test_input", "expected"),
     [
@@ -183,3 +95,86 @@ def test_abbreviate_type(test_input, expected):
 def test_abbreviate_type_unknown():
     with pytest.raises(pep_headers.PEPParsingError):
         pep_headers._abbreviate_type("an unknown type")
+
+
+def _apply_headers(source: str) -> nodes.document:
+    settings = frontend.get_default_settings(Parser)
+    settings.pep_url = "pep-{:0>4}.html"
+    settings.builder = "html"
+    document = utils.new_document("pep-9999.rst", settings)
+    Parser(rfc2822=True).parse(source, document)
+    pep_headers.PEPHeaders(document).apply()
+    return document
+
+
+def test_header_handlers():
+    document = _apply_headers(
+        "PEP: 9999\nTitle: Test\nRequires: 8, 20\nStatus: Draft\nVersion: 1.0\n"
+    )
+
+    assert document["headers"] == {
+        "PEP": "9999", "Title": "Test", "Requires": "8, 20", "Status": "Draft", "Version": "1.0"
+    }
+    assert document[0].astext() == "PEP\n\n9999\n\nTitle\n\nTest\n\nRequires\n\n8, 20\n\nStatus\n\nDraft"
+    requires = list(document[0][2].findall(nodes.reference))
+    assert [node["refuri"] for node in requires] == ["pep-0008.html", "pep-0020.html"]
+
+
+def test_register_header_handler(monkeypatch):
+    monkeypatch.setattr(pep_headers, "HEADER_HANDLERS", pep_headers.HEADER_HANDLERS.copy())
+    seen = []
+
+    @pep_headers.register_header_handler("Reviewed-By")
+    def handler(document, name, para):
+        seen.append((name, para.astext()))
+        return name == "reviewed-by"
+
+    document = _apply_headers("PEP: 9999\nTitle: Test\nReviewed-By: Someone\n")
+
+    assert seen == [("reviewed-by", "Someone")]
+    assert document[0].astext() == "PEP\n\n9999\n\nTitle\n\nTest"
+    assert pep_headers.HEADER_HANDLERS["reviewed-by"] is handler
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("Discussions-To: https://discuss.python.org/t/pep-643/5577", "Discourse thread"),
+        ("Discussions-To: https://discuss.python.org/t/pep-643/5577?u=someone", "Discourse thread"),
+        ("Discussions-To: python-dev@python.org", "Python-Dev list"),
+        (
+            "Resolution: https://mail.python.org/archives/list/python-dev@python.org/message/ABC123/#ABC123",
+            "Python-Dev message",
+        ),
+        ("Discussions-To: https://github.com/python/peps/issues/1", "https://github.com/python/peps/issues/1"),
+    ],
+)
+def test_prettify_links(header, expected):
+    document = _apply_headers(f"PEP: 9999\nTitle: Test\n{header}\n")
+
+    assert document[0][2][1].astext() == expected
+
+
+def test_prettify_links_post_history():
+    document = _apply_headers(
+        "PEP: 9999\nTitle: Test\n"
+        "Post-History: `01-Jan-2024 <https://discuss.python.org/t/pep-9999/123/4#post_4>`__\n"
+    )
+
+    (reference,) = document[0][2].findall(nodes.reference)
+    assert reference.astext() == "01-Jan-2024"
+    assert reference["reftitle"] == "Discourse message"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://discuss.python.org/latest",
+        "https://discuss.python.org/t/pep-643",
+        "https://mail.python.org/",
+        "https://mail.python.org/pipermail/python-dev/2012-May",
+    ],
+)
+def test_prettify_links_unrecognised(url):
+    with pytest.raises(pep_headers.PEPParsingError, match="not a link to a list, message, thread or category"):
+        _apply_headers(f"PEP: 9999\nTitle: Test\nDiscussions-To: {url}\n")
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from docutils import nodes
+from docutils.frontend import get_default_settings
+from docutils.utils import new_document
+
+from pep_sphinx_extensions.pep_processor.transforms import pep_references
+
+
+def _document():
+    document = new_document("pep-0001.rst", get_default_settings())
+    section = nodes.section("", nodes.title("", "Rationale"), ids=["rationale"])
+    footnote_ref = nodes.footnote_reference("", "7", ids=["id7"])
+    section += nodes.paragraph("", "Text", footnote_ref, ids=["para"])
+    document += section
+    for node in section, footnote_ref:
+        document.set_id(node)
+    return document
+
+
+def test_section_titles():
+    out = pep_references.section_titles(_document())
+
+    assert out == {"rationale": "Rationale", "id7": "7"}
+
+
+def test_record_section_titles():
+    env = SimpleNamespace(docname="pep-0001")
+
+    pep_references.SECTION_TITLES.record(SimpleNamespace(env=env), _document())
+
+    assert env.pep_section_titles == {"pep-0001": {"rationale": "Rationale", "id7": "7"}}
+
+
+def _referencing_document(*, indexed):
+    document = new_document("pep-0008.rst", get_default_settings())
+    references = [nodes.reference("", f"PEP {pep}", _title_tuple=(pep, "")) for pep in (1, 20)]
+    document += nodes.paragraph("", "", *references, nodes.reference("", "Python", refuri="https://www.python.org/"))
+    if indexed:
+        document["pep_references"] = [references[0]]  # omitted from the index, to show it is used
+    return document
+
+
+def test_pep_role_references():
+    out = pep_references.pep_role_references(_referencing_document(indexed=True))
+
+    assert [node["_title_tuple"] for node in out] == [(1, "")]
+
+
+def test_pep_role_references_unindexed():
+    out = pep_references.pep_role_references(_referencing_document(indexed=False))
+
+    assert [node["_title_tuple"] for node in out] == [(1, ""), (20, "")]
+
+
+def test_pep_role_references_copied():
+    document = _referencing_document(indexed=True).deepcopy()
+
+    out = pep_references.pep_role_references(document)
+
+    assert [node["_title_tuple"] for node in out] == [(1, ""), (20, "")]
+    assert out == list(document.findall(nodes.reference))[:2]
+
+
+def test_pep_role_references_substitutions():
+    document = _referencing_document(indexed=True)
+    document.substitution_defs["pep"] = nodes.substitution_definition()
+
+    out = pep_references.pep_role_references(document)
+
+    assert [node["_title_tuple"] for node in out] == [(1, ""), (20, "")]
@@ -0,0 +1,30 @@
+import pytest
+
+from pep_sphinx_extensions.pep_processor.transforms import pep_title
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("PEP 8 -- Style Guide for Python Code", "PEP 8 -- Style Guide for Python Code"),
+        ("PEP 616 -- String methods: remove prefix", "PEP 616 -- String methods: remove prefix"),
+        (
+            "PEP 563 -- Module ``__setattr__``",
+            "PEP 563 -- Module <literal>__setattr__</literal>",
+        ),
+        ("PEP 1 -- See https://peps.python.org", 'PEP 1 -- See <reference refuri="https://peps.python.org">'
+                                                 "https://peps.python.org</reference>"),
+    ],
+)
+def test_line_to_nodes(text, expected):
+    out = pep_title._line_to_nodes(text)
+
+    assert "".join(map(str, out)) == expected
+
+
+def test_line_to_nodes_copies():
+    first = pep_title._line_to_nodes("PEP 604 -- Allow writing union types as ``X | Y``")
+    second = pep_title._line_to_nodes("PEP 604 -- Allow writing union types as ``X | Y``")
+
+    assert [str(node) for node in first] == [str(node) for node in second]
+    assert all(a is not b for a, b in zip(first, second))
@@ -71,6 +71,17 @@ def test_pep_details(test_input, expected):
     assert pep.details == expected
 
 
+def test_pep_derived_values():
+    pep8 = parser.PEP(PEP_ROOT / "pep-0008.rst")
+
+    assert not hasattr(pep8, "__dict__")
+    assert pep8.joined_authors == "Guido van Rossum, Barry Warsaw, Alyssa Coghlan"
+    assert pep8.url == "https://peps.python.org/pep-0008/"
+    # Derived values are computed when parsing, so the headers can't change
+    with pytest.raises(AttributeError, match="immutable"):
+        pep8.status = STATUS_FINAL
+
+
 @pytest.mark.parametrize(
     ("test_input", "expected"),
     [
@@ -124,10 +135,14 @@ def test_parse_authors_invalid():
         (TYPE_STANDARDS, STATUS_PROVISIONAL, ":abbr:`SP (Standards Track, Provisional)`"),  # fmt: skip
     ],
 )
-def test_abbreviate_type_status(test_type, test_status, expected):
-    # set up dummy PEP object and monkeypatch attributes
-    pep = parser.PEP(PEP_ROOT / "pep-0008.rst")
-    pep.pep_type = test_type
-    pep.status = test_status
+def test_abbreviate_type_status(tmp_path, test_type, test_status, expected):
+    # set up dummy PEP file with the given type and status
+    filename = tmp_path / "pep-9999.rst"
+    filename.write_text(
+        "PEP: 9999\nTitle: Test\nAuthor: First Last\n"
+        f"Status: {test_status}\nType: {test_type}\nCreated: 01-Jan-2000\n",
+        encoding="utf-8",
+    )
+    pep = parser.PEP(filename)
 
     assert pep.shorthand == expected
@@ -1,4 +1,7 @@
+import pytest
+
 from pep_sphinx_extensions.pep_zero_generator import parser, pep_index_generator
+from pep_sphinx_extensions.pep_zero_generator.errors import PEPError
 
 from ..conftest import PEP_ROOT
 
@@ -9,3 +12,23 @@ def test_create_pep_json():
     out = pep_index_generator.create_pep_json(peps)
 
     assert '"url": "https://peps.python.org/pep-0008/"' in out
+
+
+def test_parse_peps_parallel(monkeypatch):
+    monkeypatch.setattr(pep_index_generator.os, "cpu_count", lambda: 2)
+    serial = pep_index_generator._parse_peps(PEP_ROOT)
+    parallel = pep_index_generator._parse_peps(PEP_ROOT, jobs=2)
+
+    assert [pep.number for pep in parallel] == [pep.number for pep in serial]
+    assert parallel[0].title == serial[0].title
+
+
+def test_parse_peps_errors(tmp_path):
+    (tmp_path / "pep-9998.rst").write_text("PEP: 9998\n", encoding="utf-8")
+    (tmp_path / "pep-9999.rst").write_text("PEP: 9999\n", encoding="utf-8")
+
+    with pytest.raises(PEPError, match="2 PEPs could not be parsed") as excinfo:
+        pep_index_generator._parse_peps(tmp_path)
+
+    assert "pep-9998.rst" in str(excinfo.value)
+    assert "pep-9999.rst" in str(excinfo.value)
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from pep_sphinx_extensions.pep_zero_generator import parser, subindices
+
+from ..conftest import PEP_ROOT
+
+
+def _env(srcdir):
+    return SimpleNamespace(
+        srcdir=srcdir, found_docs=set(), all_docs={}, pep_zero_digests={}
+    )
+
+
+def test_index_digest():
+    pep8 = parser.PEP(PEP_ROOT / "pep-0008.rst")
+    pep3333 = parser.PEP(PEP_ROOT / "pep-3333.rst")
+
+    assert subindices.index_digest([pep8]) == subindices.index_digest([pep8])
+    assert subindices.index_digest([pep8]) != subindices.index_digest([pep3333])
+    assert subindices.index_digest([pep8]) != subindices.index_digest([pep8], "html")
+
+
+def test_update_sphinx_records_digest(tmp_path):
+    env = _env(tmp_path)
+    docnames = []
+
+    subindices.update_sphinx("numerical", "text", docnames, env, digest="abc")
+
+    assert (tmp_path / "numerical.rst").read_text(encoding="utf-8") == "text"
+    assert docnames == ["numerical"]
+    assert env.found_docs == {"numerical"}
+    assert env.pep_zero_digests == {"numerical": "abc"}
+
+
+def test_is_up_to_date(tmp_path):
+    env = _env(tmp_path)
+    subindices.update_sphinx("numerical", "text", [], env, digest="abc")
+
+    # Not yet read by Sphinx
+    assert not subindices.is_up_to_date("numerical", "abc", env)
+
+    env.all_docs["numerical"] = 0
+    assert subindices.is_up_to_date("numerical", "abc", env)
+    assert not subindices.is_up_to_date("numerical", "def", env)
+
+    # Deleted from the source directory
+    (tmp_path / "numerical.rst").unlink()
+    assert not subindices.is_up_to_date("numerical", "abc", env)
+
+
+def test_remove_stale_subindices(tmp_path):
+    env = _env(tmp_path)
+    (tmp_path / "topic").mkdir()
+    docnames = []
+    for filename in ("topic/index", "topic/packaging", "topic/removed"):
+        subindices.update_sphinx(filename, "text", docnames, env, digest="abc")
+
+    subindices._remove_stale_subindices({"packaging": ""}, docnames, env)
+
+    assert sorted(path.name for path in (tmp_path / "topic").iterdir()) == ["index.rst", "packaging.rst"]
+    assert docnames == ["topic/index", "topic/packaging"]
+    assert env.found_docs == {"topic/index", "topic/packaging"}
+    assert env.pep_zero_digests == {"topic/packaging": "abc"}
@@ -4,6 +4,8 @@ import pytest
 
 from pep_sphinx_extensions.pep_zero_generator import parser, writer
 
+from ..conftest import PEP_ROOT
+
 
 def test_pep_zero_writer_emit_text_newline():
     pep0_writer = writer.PEPZeroWriter()
@@ -69,3 +71,22 @@ def test_sort_authors():
 
     # Assert
     assert out == ["Aardvark, Alfred", "lowercase, laurence", "Zebra, Zoë"]
+
+
+def test_bucket_peps():
+    # Arrange
+    peps = [
+        parser.PEP(PEP_ROOT / "pep-0008.rst"),
+        parser.PEP(PEP_ROOT / "pep-0719.rst"),
+        parser.PEP(PEP_ROOT / "pep-3333.rst"),
+    ]
+
+    # Act
+    all_peps, by_topic = writer.bucket_peps(peps, ["Release", "Typing"])
+
+    # Assert
+    assert all_peps.peps == peps
+    assert tuple(all_peps.categories) == writer._classify_peps(peps)
+    assert by_topic["release"].peps == [peps[1]]
+    assert by_topic["typing"].peps == []
+    assert sum(map(len, by_topic["release"].categories)) == 1
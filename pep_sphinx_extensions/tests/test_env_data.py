@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from pep_sphinx_extensions.env_data import PEPEnvData
+
+
+def _env_data():
+    return PEPEnvData("pep_lengths", lambda doctree: len(doctree))
+
+
+def test_record():
+    env = SimpleNamespace(docname="pep-0001")
+    app = SimpleNamespace(env=env)
+
+    _env_data().record(app, [1, 2])
+    env.docname = "topic/index"
+    _env_data().record(app, [1])
+
+    assert env.pep_lengths == {"pep-0001": 2}
+
+
+def test_purge():
+    env = SimpleNamespace(pep_lengths={"pep-0001": 2, "pep-0002": 3})
+
+    _env_data().purge(None, env, "pep-0001")
+    _env_data().purge(None, SimpleNamespace(), "pep-0001")
+
+    assert env.pep_lengths == {"pep-0002": 3}
+
+
+def test_merge():
+    env = SimpleNamespace(pep_lengths={"pep-0001": 1})
+    other = SimpleNamespace(pep_lengths={"pep-0001": 5, "pep-0002": 2})
+
+    _env_data().merge(None, env, {"pep-0002"}, other)
+
+    assert env.pep_lengths == {"pep-0001": 1, "pep-0002": 2}
+
+
+def test_data():
+    env = SimpleNamespace()
+
+    data = _env_data().data(env)
+
+    assert data == {}
+    assert env.pep_lengths is data
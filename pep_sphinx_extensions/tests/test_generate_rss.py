@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from docutils import nodes
+
+from pep_sphinx_extensions import generate_rss
+
+
+def _metadata(number, created):
+    return {
+        "PEP": str(number),
+        "Title": f"Title {number}",
+        "Author": "Author Name",
+        "Created": created,
+        "Abstract": f"Abstract {number}",
+    }
+
+
+def test_generate_items_newest_first(tmp_path):
+    metadata = {}
+    for number in range(1, 16):
+        docname = f"pep-{number:0>4}"
+        (tmp_path / f"{docname}.doctree").touch()
+        metadata[docname] = _metadata(number, f"{number:0>2}-Jan-2020")
+
+    items = list(generate_rss._generate_items(tmp_path, metadata))
+
+    assert len(items) == 10
+    assert "<title>PEP 15: Title 15</title>" in items[0]
+    assert "<title>PEP 6: Title 6</title>" in items[-1]
+
+
+def test_pep_metadata():
+    document = nodes.document(None, None)
+    document["headers"] = {"PEP": "8", "Title": "Style", "Status": "Active"}
+    section = nodes.section("", nodes.title("", "Abstract"), nodes.paragraph("", "Text\nhere"))
+    document += section
+
+    out = generate_rss.pep_metadata(document)
+
+    assert out == {"PEP": "8", "Title": "Style", "Abstract": "Text here"}
+
+
+def test_lookup_pep_metadata(tmp_path):
+    document = nodes.document(None, None)
+    document["headers"] = {"PEP": "2"}
+    env = SimpleNamespace(pep_metadata={"pep-0001": {"PEP": "1"}}, doctreedir=tmp_path)
+
+    assert generate_rss.lookup_pep_metadata(env, "pep-0001", document) == {"PEP": "1"}
+    # Not recorded, so the doctree in hand is used rather than loading from disk
+    out = generate_rss.lookup_pep_metadata(env, "pep-0002", document)
+    assert out == {"PEP": "2", "Abstract": ""}
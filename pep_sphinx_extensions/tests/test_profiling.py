@@ -0,0 +1,112 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pep_sphinx_extensions import profiling
+from pep_sphinx_extensions.pep_processor.transforms import pep_references
+
+
+class FakeApp:
+    """Records event handlers, and emits events in priority order."""
+
+    def __init__(self, tags=()):
+        self.tags = set(tags)
+        self.handlers = []
+        self.written = []
+        self.builder = SimpleNamespace(write_doc=lambda docname, doctree: self.written.append(docname))
+        self.env = SimpleNamespace(docname=None)
+
+    def connect(self, event, callback, priority=500):
+        self.handlers.append((event, priority, callback))
+
+    def emit(self, event, *args):
+        for _event, _priority, callback in sorted(
+            (handler for handler in self.handlers if handler[0] == event), key=lambda handler: handler[1]
+        ):
+            callback(self, *args)
+
+    def read(self, docname):
+        self.env.docname = docname
+        self.emit("source-read", docname, [""])
+        self.emit("doctree-read", None)
+
+
+@pytest.fixture
+def app():
+    app = FakeApp()
+    profiler = profiling.BuildProfiler(app)
+    yield app, profiler
+    profiler.close()
+
+
+def test_phases(app):
+    app, profiler = app
+
+    app.emit("env-before-read-docs", None, [])
+    app.read("pep-0001")
+    app.read("pep-0008")
+    app.emit("env-updated", None)
+    app.emit("env-check-consistency", None)
+    app.builder.write_doc("pep-0008", None)
+    app.emit("build-finished", None)
+
+    assert list(profiler.phases) == [
+        "find-sources", "generate-indices", "read", "save-environment", "write", "post-build"
+    ]
+    assert all(measurement.calls == 1 for measurement in profiler.phases.values())
+    assert profiler.documents.keys() == {"pep-0001", "pep-0008"}
+    assert profiler.documents["pep-0008"].keys() == {"read", "write"}
+    assert profiler.handlers["doctree-read"].calls == 2
+    assert app.written == ["pep-0008"]
+
+
+def test_phases_single_pep():
+    app = FakeApp(tags={"single_pep"})
+    profiler = profiling.BuildProfiler(app)
+
+    app.emit("env-before-read-docs", None, [])
+    app.read("pep-0008")
+    app.emit("build-finished", None)
+    profiler.close()
+
+    assert list(profiler.phases) == ["find-sources", "read", "post-build"]
+
+
+def test_memory(app):
+    app, profiler = app
+
+    app.emit("source-read", "pep-0008", [""])
+    kept = bytearray(1024 * 1024)
+    app.env.docname = "pep-0008"
+    app.emit("doctree-read", None)
+
+    read = profiler.documents["pep-0008"]["read"]
+    assert read.allocated >= len(kept)
+    assert read.peak >= read.allocated
+
+
+def test_close_restores_transforms():
+    apply = pep_references.PEPReferenceRoleTitleText.apply
+    profiler = profiling.BuildProfiler(FakeApp())
+    assert pep_references.PEPReferenceRoleTitleText.apply is not apply
+
+    profiler.close()
+
+    assert pep_references.PEPReferenceRoleTitleText.apply is apply
+
+
+def test_report(app, tmp_path, capsys):
+    app, profiler = app
+    for docname in ("pep-0001", "pep-0008", "pep-0020"):
+        app.read(docname)
+    app.emit("build-finished", None)
+
+    profiler.write_report(tmp_path / "profile.json")
+    profiler.print_summary(top=2)
+
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert report.keys() == {"phases", "handlers", "transforms", "documents"}
+    assert report["documents"]["pep-0008"]["read"].keys() == {"calls", "seconds", "allocated", "peak"}
+    assert "PEPTitle" in report["transforms"]
+    assert "Slowest 2 documents" in capsys.readouterr().out
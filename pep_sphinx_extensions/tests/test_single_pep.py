@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+from docutils import nodes
+from docutils.frontend import get_default_settings
+from docutils.utils import new_document
+
+from pep_sphinx_extensions import single_pep
+
+
+def _app(**env):
+    config = SimpleNamespace(master_doc="pep-0008")
+    return SimpleNamespace(config=config, env=SimpleNamespace(**env))
+
+
+def test_prune_docs_to_read():
+    app = _app(all_docs={"pep-0020": 0})
+    docnames = ["contents", "pep-0001", "pep-0008", "pep-0008/appendix", "pep-0020", "pep-0080"]
+
+    single_pep.prune_docs_to_read(app, app.env, docnames)
+
+    assert docnames == ["pep-0008", "pep-0008/appendix", "pep-0020"]
+
+
+def test_record_linked_peps():
+    app = _app(docname="pep-0008")
+    document = new_document("pep-0008.rst", get_default_settings())
+    document += nodes.paragraph(
+        "", "",
+        nodes.reference("", "PEP 20", _title_tuple=(20, "")),
+        nodes.reference("", "PEP 257", _title_tuple=(257, "docstrings")),
+        nodes.reference("", "Python", refuri="https://www.python.org/"),
+    )
+
+    single_pep.record_linked_peps(app, document)
+    app.env.docname = "pep-0020"
+    single_pep.record_linked_peps(app, new_document("pep-0020.rst", get_default_settings()))
+
+    assert app.env.pep_linked_docnames == {"pep-0020", "pep-0257"}
+
+
+def test_read_linked_peps():
+    read = []
+    env = SimpleNamespace(
+        pep_linked_docnames={"pep-0008", "pep-0020", "pep-0257", "pep-9999"},
+        all_docs={"pep-0008": 0},
+        found_docs={"pep-0008", "pep-0020", "pep-0257"},
+        metadata={"pep-0020": {}, "pep-0257": {}},
+    )
+    app = SimpleNamespace(builder=SimpleNamespace(read_doc=read.append))
+
+    assert single_pep.read_linked_peps(app, env) == ["pep-0020", "pep-0257"]
+    assert read == ["pep-0020", "pep-0257"]
+    assert env.metadata["pep-0020"] == {"orphan": True}
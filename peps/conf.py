@@ -37,6 +37,9 @@ include_patterns = [
     "contents.rst",
     # PEP files
     "pep-????.rst",
+    # Generated PEP indices (see pep_zero_generator)
+    "numerical.rst",
+    "topic/*.rst",
     # PEP ancillary files
     "pep-????/*.rst",
     # PEPs API